@@ -7,12 +7,15 @@ from both PRE files and Analisi Profittabilita files.
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from decimal import Decimal
-import pandas as pd
 from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
 
+# pandas is only needed by the DataFrame export methods, which import it on first use
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -603,13 +606,14 @@ class IndustrialQuotation(BaseModel):
     # PANDAS CONVERSION METHODS
     # =============================================================================
 
-    def to_items_dataframe(self) -> pd.DataFrame:
+    def to_items_dataframe(self) -> 'pd.DataFrame':
         """
         Convert all items to a flat pandas DataFrame for analysis.
         
         Returns:
             DataFrame with one row per item, including group and category information
         """
+        import pandas as pd
         items_data = []
         
         for group in self.product_groups:
@@ -631,13 +635,14 @@ class IndustrialQuotation(BaseModel):
         
         return pd.DataFrame(items_data)
 
-    def to_categories_dataframe(self) -> pd.DataFrame:
+    def to_categories_dataframe(self) -> 'pd.DataFrame':
         """
         Convert all categories to a pandas DataFrame for analysis.
         
         Returns:
             DataFrame with one row per category, including calculated metrics
         """
+        import pandas as pd
         categories_data = []
         
         for group in self.product_groups:
@@ -659,13 +664,14 @@ class IndustrialQuotation(BaseModel):
         
         return pd.DataFrame(categories_data)
 
-    def to_groups_dataframe(self) -> pd.DataFrame:
+    def to_groups_dataframe(self) -> 'pd.DataFrame':
         """
         Convert all product groups to a pandas DataFrame for analysis.
         
         Returns:
             DataFrame with one row per product group, including aggregated metrics
         """
+        import pandas as pd
         groups_data = []
         
         for group in self.product_groups:
@@ -5,10 +5,16 @@ Converts Excel files with profitability analysis format to structured JSON accor
 
 import json
 import logging
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from typing import Dict, List, Optional, Any, Tuple
 from openpyxl import load_workbook
 
+# Optional fast JSON serializer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import unified models and field mappings
 import sys
 import os
@@ -362,6 +368,8 @@ class AnalisiProfittabilitaParser:
         self.file_path = file_path
         self.workbook = None
         self.ws = None
+        self.latest_va21_sheet = None  # Resolved once in load_workbook()
+        self.va21_rows_by_wbe = None   # VA21 rows grouped by WBE, built on first use
         
     def load_workbook(self):
         """Load the Excel workbook"""
@@ -369,6 +377,8 @@ class AnalisiProfittabilitaParser:
             self.workbook = load_workbook(self.file_path, data_only=True)
             # Use the first worksheet (typically 'NEW_OFFER1')
             self.ws = self.workbook['NEW_OFFER1']
+            self.latest_va21_sheet = self._find_latest_va21_sheet()
+            self.va21_rows_by_wbe = None
             logger.info(LogMessages.WORKBOOK_LOADED.format(self.ws.max_row, self.ws.max_column))
         except FileNotFoundError:
             raise FileNotFoundError(ErrorMessages.FILE_NOT_FOUND.format(self.file_path))
@@ -597,12 +607,12 @@ class AnalisiProfittabilitaParser:
         for group in product_groups:
             for category in group[JsonFields.CATEGORIES]:
                 if not category[JsonFields.PRICELIST_SUBTOTAL]:
-                    category[JsonFields.PRICELIST_SUBTOTAL] = sum(
-                        item[JsonFields.PRICELIST_TOTAL] for item in category[JsonFields.ITEMS]
+                    category[JsonFields.PRICELIST_SUBTOTAL] = self._sum_item_field(
+                        category[JsonFields.ITEMS], JsonFields.PRICELIST_TOTAL
                     )
                 if not category[JsonFields.COST_SUBTOTAL]:
-                    category[JsonFields.COST_SUBTOTAL] = sum(
-                        item[JsonFields.TOTAL_COST] for item in category[JsonFields.ITEMS]
+                    category[JsonFields.COST_SUBTOTAL] = self._sum_item_field(
+                        category[JsonFields.ITEMS], JsonFields.TOTAL_COST
                     )
                 if not category[JsonFields.TOTAL_COST]:
                     category[JsonFields.TOTAL_COST] = category[JsonFields.COST_SUBTOTAL]
@@ -712,6 +722,12 @@ class AnalisiProfittabilitaParser:
         except (ValueError, TypeError):
             return default
 
+    def _sum_item_field(self, items: List[Dict[str, Any]], field: str) -> float:
+        """Sum a numeric item field, treating a missing field as 0"""
+        # Plain sequential sum: on these short item lists NumPy is slower, and its
+        # pairwise summation would change the low bits of the category subtotals
+        return sum(item.get(field, 0) for item in items)
+
     def _find_latest_va21_sheet(self) -> Optional[str]:
         """
         Find the latest VA21 sheet in the workbook.
@@ -732,7 +748,7 @@ class AnalisiProfittabilitaParser:
         va21_sheets.sort()
         latest_sheet = va21_sheets[-1]  # Last in sorted order should be latest version
         
-        logger.info(f"Found VA21 sheets: {va21_sheets}, using latest: {latest_sheet}")
+        logger.info("Found VA21 sheets: %s, using latest: %s", va21_sheets, latest_sheet)
         return latest_sheet
 
     def _convert_wbe_us_to_it(self, wbe_us: str) -> str:
@@ -765,7 +781,7 @@ class AnalisiProfittabilitaParser:
         Returns:
             Dictionary mapping WBE codes to total offer prices
         """
-        latest_sheet = self._find_latest_va21_sheet()
+        latest_sheet = self.latest_va21_sheet
         if not latest_sheet:
             logger.warning("No VA21 sheet found, offer prices will not be available")
             return {}
@@ -775,8 +791,9 @@ class AnalisiProfittabilitaParser:
             wbe_offers = {}
             processed_rows = 0
             valid_offer_rows = 0
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             
-            logger.info(f"Extracting offer data from sheet '{latest_sheet}' (Column D for WBE, Column Y for offers)")
+            logger.info("Extracting offer data from sheet '%s' (Column D for WBE, Column Y for offers)", latest_sheet)
             
             # Extract WBE-Offer mappings starting from data row
             for row in range(VA21Rows.DATA_START_ROW, va21_ws.max_row + 1):
@@ -792,9 +809,9 @@ class AnalisiProfittabilitaParser:
                 offer_val = offer_cell.value
                 
                 # Log all rows for debugging (only first 10 and last 10 to avoid spam)
-                if processed_rows <= 10 or processed_rows > va21_ws.max_row - 10:
+                if debug_enabled and (processed_rows <= 10 or processed_rows > va21_ws.max_row - 10):
                     if wbe_val or wbe_backup_val or offer_val:
-                        logger.debug(f"Row {row}: WBE_D='{wbe_val}', WBE_C='{wbe_backup_val}', Offer={offer_val}")
+                        logger.debug("Row %d: WBE_D='%s', WBE_C='%s', Offer=%s", row, wbe_val, wbe_backup_val, offer_val)
                 
                 # Determine which WBE to use
                 final_wbe = None
@@ -816,30 +833,34 @@ class AnalisiProfittabilitaParser:
                     # Sum offers for the same WBE (handle multiple entries for same WBE)
                     if final_wbe not in wbe_offers:
                         wbe_offers[final_wbe] = 0
-                        logger.debug(f"Row {row}: First occurrence of WBE '{final_wbe}': €{offer_clean:,.2f}")
-                    else:
-                        logger.debug(f"Row {row}: Additional entry for WBE '{final_wbe}': +€{offer_clean:,.2f} (previous: €{wbe_offers[final_wbe]:,.2f})")
+                        if debug_enabled:
+                            logger.debug("Row %d: First occurrence of WBE '%s': €%0.2f", row, final_wbe, offer_clean)
+                    elif debug_enabled:
+                        logger.debug("Row %d: Additional entry for WBE '%s': +€%0.2f (previous: €%0.2f)",
+                                     row, final_wbe, offer_clean, wbe_offers[final_wbe])
                     
                     wbe_offers[final_wbe] += offer_clean
-                    logger.debug(f"Row {row}: WBE '{final_wbe}' total now: €{wbe_offers[final_wbe]:,.2f}")
+                    if debug_enabled:
+                        logger.debug("Row %d: WBE '%s' total now: €%0.2f", row, final_wbe, wbe_offers[final_wbe])
                     
-                elif (wbe_val or wbe_backup_val) and offer_val is not None:
+                elif debug_enabled and (wbe_val or wbe_backup_val) and offer_val is not None:
                     # Log cases where we have data but it's not being processed
-                    logger.debug(f"Row {row}: Skipping WBE_D='{wbe_val}', WBE_C='{wbe_backup_val}', Offer={offer_val} (invalid format)")
+                    logger.debug("Row %d: Skipping WBE_D='%s', WBE_C='%s', Offer=%s (invalid format)",
+                                 row, wbe_val, wbe_backup_val, offer_val)
             
-            logger.info(f"Processed {processed_rows} rows, found {valid_offer_rows} rows with valid offers")
-            logger.info(f"Successfully extracted {len(wbe_offers)} unique WBE codes with summed offers from VA21")
+            logger.info("Processed %d rows, found %d rows with valid offers", processed_rows, valid_offer_rows)
+            logger.info("Successfully extracted %d unique WBE codes with summed offers from VA21", len(wbe_offers))
             
             # Log summary of extracted WBE offers
             total_extracted_offer = sum(wbe_offers.values())
-            logger.info(f"Total offer value extracted: €{total_extracted_offer:,.2f}")
+            logger.info("Total offer value extracted: €%0.2f", total_extracted_offer)
             
             # Log first few WBE mappings for debugging
             wbe_items = list(wbe_offers.items())
             for i, (wbe, offer) in enumerate(wbe_items[:5]):
-                logger.info(f"  WBE '{wbe}' -> €{offer:,.2f}")
+                logger.info("  WBE '%s' -> €%0.2f", wbe, offer)
             if len(wbe_offers) > 5:
-                logger.info(f"  ... and {len(wbe_offers) - 5} more WBE codes")
+                logger.info("  ... and %d more WBE codes", len(wbe_offers) - 5)
             
             # Check for any WBEs that have multiple entries (were summed)
             wbe_counts = {}
@@ -864,18 +885,18 @@ class AnalisiProfittabilitaParser:
             # Log WBEs that appeared multiple times
             duplicated_wbes = {wbe: count for wbe, count in wbe_counts.items() if count > 1}
             if duplicated_wbes:
-                logger.info(f"Found {len(duplicated_wbes)} WBE codes with multiple entries (values were summed):")
+                logger.info("Found %d WBE codes with multiple entries (values were summed):", len(duplicated_wbes))
                 for wbe, count in list(duplicated_wbes.items())[:5]:
-                    logger.info(f"  WBE '{wbe}': {count} entries, total €{wbe_offers[wbe]:,.2f}")
+                    logger.info("  WBE '%s': %d entries, total €%0.2f", wbe, count, wbe_offers[wbe])
                 if len(duplicated_wbes) > 5:
-                    logger.info(f"  ... and {len(duplicated_wbes) - 5} more duplicated WBEs")
+                    logger.info("  ... and %d more duplicated WBEs", len(duplicated_wbes) - 5)
             else:
                 logger.info("All WBE codes had unique entries (no duplication/summing needed)")
             
             return wbe_offers
             
         except Exception as e:
-            logger.error(f"Error extracting VA21 data from sheet '{latest_sheet}': {e}")
+            logger.error("Error extracting VA21 data from sheet '%s': %s", latest_sheet, e)
             return {}
 
     def integrate_va21_offers_into_categories(self, product_groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -896,11 +917,12 @@ class AnalisiProfittabilitaParser:
             logger.warning("No VA21 offer data available, categories will not have offer prices")
             return product_groups
         
-        logger.info(f"Starting integration of VA21 offers into {sum(len(g.get('categories', [])) for g in product_groups)} categories")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting integration of VA21 offers into %d categories",
+                        sum(len(g.get('categories', [])) for g in product_groups))
         
         matched_offers = 0
         total_matched_value = 0
-        existing_wbes = set()
         merged_wbes = set()  # Track WBEs that have been merged with VA21 data
         
         # First pass: integrate offer prices into existing categories and merge VA21 data
@@ -909,8 +931,6 @@ class AnalisiProfittabilitaParser:
                 category_wbe = category.get(JsonFields.WBE, "")
                 
                 if category_wbe:
-                    existing_wbes.add(category_wbe)
-                    
                     # Look up offer price directly in VA21 data
                     offer_price = va21_offers.get(category_wbe, 0.0)
                     
@@ -921,26 +941,32 @@ class AnalisiProfittabilitaParser:
                         matched_offers += 1
                         total_matched_value += offer_price
                         merged_wbes.add(category_wbe)
-                        logger.info(f"✓ Matched category WBE '{category_wbe}' -> Offer: €{offer_price:,.2f}")
+                        logger.info("✓ Matched category WBE '%s' -> Offer: €%0.2f", category_wbe, offer_price)
                         
                         # Merge VA21 data into existing category items if available
                         self._merge_va21_data_into_category(category, category_wbe)
                     else:
-                        logger.warning(f"✗ No offer price found for category WBE '{category_wbe}'")
+                        logger.warning("✗ No offer price found for category WBE '%s'", category_wbe)
                 else:
                     # No WBE code, set offer price to 0
                     category[JsonFields.OFFER_PRICE] = 0.0
                     logger.debug("Category has no WBE code, setting offer price to 0")
         
         # Second pass: identify truly unmapped WBEs from VA21 (not merged in first pass)
-        unmapped_wbes = {wbe: offer for wbe, offer in va21_offers.items() 
-                        if wbe not in merged_wbes and wbe not in existing_wbes}
+        existing_wbes = {
+            category[JsonFields.WBE]
+            for group in product_groups
+            for category in group[JsonFields.CATEGORIES]
+            if category.get(JsonFields.WBE)
+        }
+        mapped_wbes = merged_wbes | existing_wbes
+        unmapped_wbes = {wbe: offer for wbe, offer in va21_offers.items() if wbe not in mapped_wbes}
         
         if unmapped_wbes:
-            logger.info(f"Found {len(unmapped_wbes)} truly unmapped WBE codes in VA21, creating new categories")
+            logger.info("Found %d truly unmapped WBE codes in VA21, creating new categories", len(unmapped_wbes))
             
             # Get VA21 worksheet and headers for data extraction
-            latest_sheet = self._find_latest_va21_sheet()
+            latest_sheet = self.latest_va21_sheet
             if latest_sheet:
                 va21_ws = self.workbook[latest_sheet]
                 headers = self.extract_va21_headers(va21_ws)
@@ -960,25 +986,25 @@ class AnalisiProfittabilitaParser:
                         va21_group[JsonFields.CATEGORIES].append(new_category)
                         matched_offers += 1
                         total_matched_value += offer_price
-                        logger.info(f"✓ Created new category for unmapped WBE '{wbe_code}' -> Offer: €{offer_price:,.2f}")
+                        logger.info("✓ Created new category for unmapped WBE '%s' -> Offer: €%0.2f", wbe_code, offer_price)
                     except Exception as e:
-                        logger.error(f"Failed to create category for WBE '{wbe_code}': {e}")
+                        logger.error("Failed to create category for WBE '%s': %s", wbe_code, e)
                 
                 # Add the VA21 group if it has categories
                 if va21_group[JsonFields.CATEGORIES]:
                     product_groups.append(va21_group)
-                    logger.info(f"Added new group 'TXT-VA21' with {len(va21_group[JsonFields.CATEGORIES])} categories from VA21")
+                    logger.info("Added new group 'TXT-VA21' with %d categories from VA21", len(va21_group[JsonFields.CATEGORIES]))
         else:
             logger.info("All VA21 WBE codes were successfully merged into existing categories")
         
         # Verify total offer prices match
         final_total_offers = sum(va21_offers.values())
-        logger.info(f"Integration completed: {matched_offers} total categories with total value €{total_matched_value:,.2f}")
-        logger.info(f"VA21 total: €{final_total_offers:,.2f}, Integrated total: €{total_matched_value:,.2f}")
-        logger.info(f"Merged into existing: {len(merged_wbes)}, New categories: {len(unmapped_wbes)}")
+        logger.info("Integration completed: %d total categories with total value €%0.2f", matched_offers, total_matched_value)
+        logger.info("VA21 total: €%0.2f, Integrated total: €%0.2f", final_total_offers, total_matched_value)
+        logger.info("Merged into existing: %d, New categories: %d", len(merged_wbes), len(unmapped_wbes))
         
         if abs(final_total_offers - total_matched_value) > 0.01:  # Allow for small rounding differences
-            logger.warning(f"Total mismatch: VA21 total €{final_total_offers:,.2f} != Integrated total €{total_matched_value:,.2f}")
+            logger.warning("Total mismatch: VA21 total €%0.2f != Integrated total €%0.2f", final_total_offers, total_matched_value)
         else:
             logger.info("✓ Total offer prices match between VA21 and integrated categories")
         
@@ -993,7 +1019,7 @@ class AnalisiProfittabilitaParser:
             wbe_code: WBE code to look up in VA21
         """
         try:
-            latest_sheet = self._find_latest_va21_sheet()
+            latest_sheet = self.latest_va21_sheet
             if not latest_sheet:
                 return
             
@@ -1002,45 +1028,31 @@ class AnalisiProfittabilitaParser:
             
             # Find VA21 rows for this WBE and extract additional data
             va21_items = []
-            for row in range(VA21Rows.DATA_START_ROW, va21_ws.max_row + 1):
-                # Check both Column D and Column C for WBE
-                wbe_cell_d = va21_ws.cell(row=row, column=VA21Columns.WBE)
-                wbe_cell_c = va21_ws.cell(row=row, column=VA21Columns.WBE_BACKUP)
-                
-                wbe_val_d = wbe_cell_d.value
-                wbe_val_c = wbe_cell_c.value
-                
-                # Determine WBE for this row
-                row_wbe = None
-                if wbe_val_d and str(wbe_val_d).strip() and str(wbe_val_d).strip() != 'None':
-                    row_wbe = str(wbe_val_d).strip()
-                elif wbe_val_c and str(wbe_val_c).strip() and str(wbe_val_c).strip() != 'None':
-                    row_wbe = self._convert_wbe_us_to_it(str(wbe_val_c).strip())
-                
-                if row_wbe == wbe_code:
-                    # Extract item data from this VA21 row
-                    item_data = self.extract_va21_row_data(va21_ws, row, headers)
-                    if item_data.get(JsonFields.DESCRIPTION):  # Only add if has description
-                        # Mark this as VA21 source data
-                        item_data['va21_source'] = True
-                        item_data[JsonFields.POSITION] = f"VA21-{row}"
-                        va21_items.append(item_data)
+            min_col, rows_by_wbe = self._group_va21_rows_by_wbe(va21_ws, headers)
+            for row, row_values in rows_by_wbe.get(wbe_code, []):
+                # Extract item data from this VA21 row
+                item_data = self.extract_va21_row_data(va21_ws, row, headers, row_values, min_col, wbe_code)
+                if item_data.get(JsonFields.DESCRIPTION):  # Only add if has description
+                    # Mark this as VA21 source data
+                    item_data['va21_source'] = True
+                    item_data[JsonFields.POSITION] = f"VA21-{row}"
+                    va21_items.append(item_data)
             
             # Add VA21 items to the existing category
             if va21_items:
                 category[JsonFields.ITEMS].extend(va21_items)
-                logger.debug(f"Merged {len(va21_items)} VA21 items into existing category '{wbe_code}'")
+                logger.debug("Merged %d VA21 items into existing category '%s'", len(va21_items), wbe_code)
                 
                 # Recalculate category totals to include VA21 data
-                total_listino = sum(item.get(JsonFields.PRICELIST_TOTAL, 0) for item in category[JsonFields.ITEMS])
-                total_cost = sum(item.get(JsonFields.TOTAL_COST, 0) for item in category[JsonFields.ITEMS])
+                total_listino = self._sum_item_field(category[JsonFields.ITEMS], JsonFields.PRICELIST_TOTAL)
+                total_cost = self._sum_item_field(category[JsonFields.ITEMS], JsonFields.TOTAL_COST)
                 
                 # Update category totals (but preserve original subtotals from NEW_OFFER1)
                 category['total_listino_with_va21'] = total_listino
                 category['total_cost_with_va21'] = total_cost
                 
         except Exception as e:
-            logger.warning(f"Failed to merge VA21 data for WBE '{wbe_code}': {e}")
+            logger.warning("Failed to merge VA21 data for WBE '%s': %s", wbe_code, e)
 
     def extract_va21_headers(self, va21_ws) -> Dict[int, str]:
         """
@@ -1063,10 +1075,65 @@ class AnalisiProfittabilitaParser:
                 if header_name:
                     headers[col] = header_name
         
-        logger.info(f"Extracted {len(headers)} headers from VA21 row {header_row}")
+        logger.info("Extracted %d headers from VA21 row %d", len(headers), header_row)
         return headers
 
-    def extract_va21_row_data(self, va21_ws, row: int, headers: Dict[int, str]) -> Dict[str, Any]:
+    def _va21_column_window(self, headers: Dict[int, str]) -> Tuple[int, int]:
+        """
+        Compute the narrowest column span covering the mapped VA21 headers and the WBE columns.
+        
+        Args:
+            headers: Column headers mapping
+            
+        Returns:
+            Tuple of (min_col, max_col), 1-based and inclusive
+        """
+        columns = [col for col, header_name in headers.items() if header_name in VA21FieldMapping.MAPPINGS]
+        columns.extend((VA21Columns.WBE, VA21Columns.WBE_BACKUP))
+        return min(columns), max(columns)
+
+    def _group_va21_rows_by_wbe(self, va21_ws, headers: Dict[int, str]) -> Tuple[int, Dict[str, List[Tuple[int, tuple]]]]:
+        """
+        Group the VA21 data rows by their resolved WBE code.
+        The sheet is scanned once and the result is reused by every category lookup.
+        
+        Args:
+            va21_ws: VA21 worksheet
+            headers: Column headers mapping
+            
+        Returns:
+            Tuple of (min_col, {wbe_code: [(row, row_values), ...]}) where min_col is the
+            first column (1-based) contained in each row_values tuple
+        """
+        if self.va21_rows_by_wbe is not None:
+            return self.va21_rows_by_wbe
+        
+        min_col, max_col = self._va21_column_window(headers)
+        rows_by_wbe = {}
+        for row, row_values in enumerate(
+            va21_ws.iter_rows(min_row=VA21Rows.DATA_START_ROW, min_col=min_col, max_col=max_col, values_only=True),
+            start=VA21Rows.DATA_START_ROW
+        ):
+            # Check both Column D and Column C for WBE
+            wbe_val_d = row_values[VA21Columns.WBE - min_col]
+            wbe_val_c = row_values[VA21Columns.WBE_BACKUP - min_col]
+            
+            # Determine WBE for this row
+            row_wbe = None
+            if wbe_val_d and str(wbe_val_d).strip() and str(wbe_val_d).strip() != 'None':
+                row_wbe = str(wbe_val_d).strip()
+            elif wbe_val_c and str(wbe_val_c).strip() and str(wbe_val_c).strip() != 'None':
+                row_wbe = self._convert_wbe_us_to_it(str(wbe_val_c).strip())
+            
+            if row_wbe:
+                rows_by_wbe.setdefault(row_wbe, []).append((row, row_values))
+        
+        self.va21_rows_by_wbe = (min_col, rows_by_wbe)
+        return self.va21_rows_by_wbe
+
+    def extract_va21_row_data(self, va21_ws, row: int, headers: Dict[int, str],
+                              row_values: Optional[tuple] = None, min_col: int = 1,
+                              row_wbe: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract data from a VA21 row and map it to NEW_OFFER1 fields.
         
@@ -1074,6 +1141,9 @@ class AnalisiProfittabilitaParser:
             va21_ws: VA21 worksheet
             row: Row number to extract
             headers: Column headers mapping
+            row_values: Optional row values already read with iter_rows(values_only=True)
+            min_col: First column (1-based) contained in row_values
+            row_wbe: Optional WBE code already resolved for this row; WBE columns are not re-read
             
         Returns:
             Dictionary with mapped field data
@@ -1082,20 +1152,27 @@ class AnalisiProfittabilitaParser:
         
         # Extract raw data from VA21 row
         for col, header_name in headers.items():
-            cell = va21_ws.cell(row=row, column=col)
-            
             # Map VA21 field to NEW_OFFER1 field if mapping exists
             if header_name in VA21FieldMapping.MAPPINGS:
                 new_offer_field = VA21FieldMapping.MAPPINGS[header_name]
+                if row_wbe is not None and new_offer_field == JsonFields.WBE:
+                    continue
+                if row_values is not None:
+                    value = row_values[col - min_col]
+                else:
+                    value = va21_ws.cell(row=row, column=col).value
                 
                 # Convert cell value based on field type
-                if cell.value is not None:
+                if value is not None:
                     if new_offer_field in [JsonFields.QTY, JsonFields.PRICELIST_TOTAL, JsonFields.PRICELIST_UNIT_PRICE]:
                         # Numeric fields
-                        row_data[new_offer_field] = self._safe_float(cell.value)
+                        row_data[new_offer_field] = self._safe_float(value)
                     else:
                         # Text fields
-                        row_data[new_offer_field] = str(cell.value).strip()
+                        row_data[new_offer_field] = str(value).strip()
+        
+        if row_wbe is not None:
+            row_data[JsonFields.WBE] = row_wbe
         
         # Set default values for missing fields
         row_data.setdefault(JsonFields.POSITION, str(row))
@@ -1151,28 +1228,14 @@ class AnalisiProfittabilitaParser:
         wbe_rows = []
         items = []
         
-        for row in range(VA21Rows.DATA_START_ROW, va21_ws.max_row + 1):
-            # Check both Column D and Column C for WBE
-            wbe_cell_d = va21_ws.cell(row=row, column=VA21Columns.WBE)
-            wbe_cell_c = va21_ws.cell(row=row, column=VA21Columns.WBE_BACKUP)
+        min_col, rows_by_wbe = self._group_va21_rows_by_wbe(va21_ws, headers)
+        for row, row_values in rows_by_wbe.get(wbe_code, []):
+            wbe_rows.append(row)
             
-            wbe_val_d = wbe_cell_d.value
-            wbe_val_c = wbe_cell_c.value
-            
-            # Determine WBE for this row
-            row_wbe = None
-            if wbe_val_d and str(wbe_val_d).strip() and str(wbe_val_d).strip() != 'None':
-                row_wbe = str(wbe_val_d).strip()
-            elif wbe_val_c and str(wbe_val_c).strip() and str(wbe_val_c).strip() != 'None':
-                row_wbe = self._convert_wbe_us_to_it(str(wbe_val_c).strip())
-            
-            if row_wbe == wbe_code:
-                wbe_rows.append(row)
-                
-                # Extract item data from this row
-                item_data = self.extract_va21_row_data(va21_ws, row, headers)
-                if item_data.get(JsonFields.DESCRIPTION):  # Only add if has description
-                    items.append(item_data)
+            # Extract item data from this row
+            item_data = self.extract_va21_row_data(va21_ws, row, headers, row_values, min_col, wbe_code)
+            if item_data.get(JsonFields.DESCRIPTION):  # Only add if has description
+                items.append(item_data)
         
         # If no items found, create a dummy item
         if not items:
@@ -1206,8 +1269,8 @@ class AnalisiProfittabilitaParser:
             }]
         
         # Calculate category totals
-        total_listino = sum(item.get(JsonFields.PRICELIST_TOTAL, 0) for item in items)
-        total_cost = sum(item.get(JsonFields.TOTAL_COST, 0) for item in items)
+        total_listino = self._sum_item_field(items, JsonFields.PRICELIST_TOTAL)
+        total_cost = self._sum_item_field(items, JsonFields.TOTAL_COST)
         
         # Create category
         category = {
@@ -1222,7 +1285,7 @@ class AnalisiProfittabilitaParser:
             JsonFields.ITEMS: items
         }
         
-        logger.info(f"Created new category for VA21 WBE '{wbe_code}' with {len(items)} items and offer €{offer_price:,.2f}")
+        logger.info("Created new category for VA21 WBE '%s' with %d items and offer €%0.2f", wbe_code, len(items), offer_price)
         return category
 
 def parse_analisi_profittabilita_to_json(file_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
@@ -1240,8 +1303,12 @@ def parse_analisi_profittabilita_to_json(file_path: str, output_path: Optional[s
     result = parser.parse()
     
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
         logger.info(LogMessages.JSON_SAVED.format(output_path))
     
     return result
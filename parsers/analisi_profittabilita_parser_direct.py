@@ -5,12 +5,23 @@ Converts Excel files with Analisi Profittabilita format directly to IndustrialQu
 """
 
 import logging
-import decimal
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Iterator
 from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from itertools import islice
+import numpy as np
 from openpyxl import load_workbook
 
+# Optional Rust-backed reader for faster sheet ingestion
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
 # Import unified models
 import sys
 import os
@@ -144,6 +155,7 @@ class VA21Columns:
 class VA21Rows:
     DATA_START_ROW = 19              # Data starts from row 18
     HEADER_ROW = 18                  # Headers are in row 18
+    MAX_BLANK_RUN = 50               # Stop reading after this many consecutive blank rows
 
 # Excel Row Constants
 class ExcelRows:
@@ -151,6 +163,7 @@ class ExcelRows:
     DATA_START_ROW = 4
     PROJECT_INFO_START = 1
     PROJECT_INFO_END = 6
+    MAX_BLANK_RUN = 50               # Stop reading after this many consecutive blank rows
 
 # Project Information Cell Positions (row, column)
 class ProjectInfoCells:
@@ -162,10 +175,165 @@ class IdentificationPatterns:
     GROUP_PREFIX = 'TXT'
     CATEGORY_CODE_LENGTH = 4
     HEADER_CODE = 'COD'
+    HEADER_DESCRIPTION = 'DENOMINAZIONE'  # Header text repeated inside the data area
     VA21_SHEET_PREFIX = 'VA21'       # Prefix for VA21 sheets
     WBE_IT_SUFFIX = '-IT'            # Italian WBE suffix in NEW_OFFER1
     WBE_US_SUFFIX = '-US'            # US WBE suffix in VA21 sheets
 
+# Quantizer for 2-place rounding (Decimals are immutable, so one instance can be reused)
+DECIMAL_CENT = Decimal("0.01")
+
+# Cell values treated as empty by the numeric converters
+NULL_NUMERIC_STRINGS = frozenset(['n/a', 'na', 'null', 'none', '-', ''])
+
+def _to_float(value: Any, default: float = 0.0) -> float:
+    """Convert a raw cell value to float, stripping currency symbols, separators and a trailing %"""
+    # Empty and numeric cells are by far the most common; neither needs string cleaning
+    if value is None:
+        return default
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return float(value)
+    if value == "" or value_type is bool:
+        # Boolean cells are not amounts; they always fell through to the default
+        return default
+    
+    try:
+        str_value = str(value).strip()
+        if str_value.lower() in NULL_NUMERIC_STRINGS:
+            return default
+        
+        # Remove currency symbols and common formatting
+        # (chained replace() measured faster than str.translate or re.sub on these short strings)
+        str_value = str_value.replace('€', '').replace('$', '').replace(',', '').strip()
+        
+        # Handle percentage notation
+        if str_value.endswith('%'):
+            return float(str_value[:-1]) / 100
+        
+        return float(str_value)
+        
+    except (ValueError, TypeError) as e:
+        logger.debug(f"Could not convert '{value}' to float: {e}")
+        return default
+
+# QuotationItem numeric fields decoded with _to_float: (field name, 0-based column index)
+ITEM_NUMERIC_FIELDS = (
+    ("quantity", ExcelColumns.QTA - 1),
+    ("pricelist_unit_price", ExcelColumns.LIST_UNIT - 1),
+    ("pricelist_total_price", ExcelColumns.LISTINO_TOTALE - 1),
+    ("unit_cost", ExcelColumns.COSTO_UNITARIO - 1),
+    ("total_cost", ExcelColumns.COSTO_TOTALE - 1),
+    
+    # Engineering and manufacturing costs
+    ("utm_robot", ExcelColumns.UTM_ROBOT - 1),
+    ("utm_robot_h", ExcelColumns.UTM_ROBOT_H - 1),
+    ("utm_lgv", ExcelColumns.UTM_LGV - 1),
+    ("utm_lgv_h", ExcelColumns.UTM_LGV_H - 1),
+    ("utm_intra", ExcelColumns.UTM_INTRA - 1),
+    ("utm_intra_h", ExcelColumns.UTM_INTRA_H - 1),
+    ("utm_layout", ExcelColumns.UTM_LAYOUT - 1),
+    ("utm_layout_h", ExcelColumns.UTM_LAYOUT_H - 1),
+    
+    # Engineering costs
+    ("ute", ExcelColumns.UTE - 1),
+    ("ute_h", ExcelColumns.UTE_H - 1),
+    ("ba", ExcelColumns.BA - 1),
+    ("ba_h", ExcelColumns.BA_H - 1),
+    ("sw_pc", ExcelColumns.SW_PC - 1),
+    ("sw_pc_h", ExcelColumns.SW_PC_H - 1),
+    ("sw_plc", ExcelColumns.SW_PLC - 1),
+    ("sw_plc_h", ExcelColumns.SW_PLC_H - 1),
+    ("sw_lgv", ExcelColumns.SW_LGV - 1),
+    ("sw_lgv_h", ExcelColumns.SW_LGV_H - 1),
+    
+    # Manufacturing costs
+    ("mtg_mec", ExcelColumns.MTG_MEC - 1),
+    ("mtg_mec_h", ExcelColumns.MTG_MEC_H - 1),
+    ("mtg_mec_intra", ExcelColumns.MTG_MEC_INTRA - 1),
+    ("mtg_mec_intra_h", ExcelColumns.MTG_MEC_INTRA_H - 1),
+    ("cab_ele", ExcelColumns.CAB_ELE - 1),
+    ("cab_ele_h", ExcelColumns.CAB_ELE_H - 1),
+    ("cab_ele_intra", ExcelColumns.CAB_ELE_INTRA - 1),
+    ("cab_ele_intra_h", ExcelColumns.CAB_ELE_INTRA_H - 1),
+    
+    # Testing and field costs
+    ("site", ExcelColumns.SITE - 1),
+    ("site_h", ExcelColumns.SITE_H - 1),
+    ("install", ExcelColumns.INSTALL - 1),
+    ("install_h", ExcelColumns.INSTALL_H - 1),
+    
+    # Additional costs
+    ("pm_cost", ExcelColumns.PM_COST - 1),
+    ("pm_h", ExcelColumns.PM_H - 1),
+    ("document", ExcelColumns.DOCUMENT - 1),
+    ("document_h", ExcelColumns.DOCUMENT_H - 1),
+    ("after_sales", ExcelColumns.AFTER_SALES - 1),
+)
+
+# QuotationItem text fields, empty when the cell is blank: (field name, 0-based column index)
+ITEM_TEXT_FIELDS = (
+    ("cod_listino", ExcelColumns.COD_LISTINO - 1),
+    ("internal_code", ExcelColumns.COD_2 - 1),
+)
+
+# Minimum row tuple length needed to decode a NEW_OFFER1 data row
+DATA_ROW_WIDTH = max(ExcelColumns.AFTER_SALES, ExcelColumns.COD_2, ExcelColumns.PRIORITY)
+
+# Column window read from the VA21 sheet
+VA21_MIN_COL = min(VA21Columns.WBE_BACKUP, VA21Columns.WBE, VA21Columns.COD, VA21Columns.DESCRIPTION,
+                   VA21Columns.QUANTITY, VA21Columns.LISTINO_SUBTOTAL, VA21Columns.DISCOUNT,
+                   VA21Columns.OFFER_TOTAL, VA21Columns.COST_SUBTOTAL, VA21Columns.MARGIN_PERCENTAGE)
+VA21_ROW_WIDTH = max(VA21Columns.WBE_BACKUP, VA21Columns.WBE, VA21Columns.COD, VA21Columns.DESCRIPTION,
+                     VA21Columns.QUANTITY, VA21Columns.LISTINO_SUBTOTAL, VA21Columns.DISCOUNT,
+                     VA21Columns.OFFER_TOTAL, VA21Columns.COST_SUBTOTAL, VA21Columns.MARGIN_PERCENTAGE)
+
+# Columns whose cells are read as text (str()'d or kept as codes); calamine reports every number
+# as float, so integral values in these columns are turned back into the int openpyxl yields
+DATA_TEXT_COLUMNS = (
+    ExcelColumns.COD, ExcelColumns.WBE, ExcelColumns.POSITION, ExcelColumns.CODICE,
+    ExcelColumns.COD_LISTINO, ExcelColumns.DENOMINAZIONE, ExcelColumns.COD_2,
+)
+VA21_TEXT_COLUMNS = (VA21Columns.WBE_BACKUP, VA21Columns.WBE, VA21Columns.COD, VA21Columns.DESCRIPTION)
+
+# Length of the fixed US suffix replaced when converting VA21 WBE codes
+WBE_US_SUFFIX_LENGTH = len(IdentificationPatterns.WBE_US_SUFFIX)
+
+@lru_cache(maxsize=None)
+def _convert_wbe_us_to_it_cached(wbe_us: str) -> str:
+    """Swap the -US suffix for -IT; memoized since VA21 rows repeat the same WBE codes"""
+    if wbe_us.endswith(IdentificationPatterns.WBE_US_SUFFIX):
+        result = wbe_us[:-WBE_US_SUFFIX_LENGTH] + IdentificationPatterns.WBE_IT_SUFFIX
+        logger.debug("Converted WBE from %s to %s", wbe_us, result)
+        return result
+    return wbe_us
+
+# Project info cells as (field, 0-based row offset from PROJECT_INFO_START, 1-based column),
+# plus the bounds of the single read that fetches all of them
+PROJECT_INFO_FIELDS = (
+    ('project_id', ProjectInfoCells.PROJECT_ID[0] - ExcelRows.PROJECT_INFO_START, ProjectInfoCells.PROJECT_ID[1]),
+    ('listino', ProjectInfoCells.LISTINO[0] - ExcelRows.PROJECT_INFO_START, ProjectInfoCells.LISTINO[1]),
+)
+PROJECT_INFO_MAX_ROW = max(ProjectInfoCells.PROJECT_ID[0], ProjectInfoCells.LISTINO[0])
+PROJECT_INFO_MAX_COL = max(ProjectInfoCells.PROJECT_ID[1], ProjectInfoCells.LISTINO[1])
+PROJECT_INFO_TEXT_COLUMNS = (ProjectInfoCells.PROJECT_ID[1], ProjectInfoCells.LISTINO[1])
+
+# Category fields summed into QuotationTotals (pricelist, cost, offer, margin)
+TOTALS_CATEGORY_FIELDS = ('pricelist_subtotal', 'cost_subtotal', 'offer_price', 'margin_amount')
+
+# Classifier constants bound at module level for the per-row hot path
+GROUP_PREFIX = IdentificationPatterns.GROUP_PREFIX
+GROUP_PREFIX_LENGTH = len(GROUP_PREFIX)
+CATEGORY_CODE_LENGTH = IdentificationPatterns.CATEGORY_CODE_LENGTH
+HEADER_DESCRIPTION = IdentificationPatterns.HEADER_DESCRIPTION
+
+# Row classification for the NEW_OFFER1 sheet
+class RowKind:
+    GROUP = 'group'                  # TXT code in CODICE
+    CATEGORY = 'category'            # 4-char code in COD
+    ITEM = 'item'                    # Has a description and is not the header row
+    SKIP = 'skip'
+
 # =============================================================================
 # DIRECT ANALISI PROFITTABILITA PARSER
 # =============================================================================
@@ -177,22 +345,43 @@ class DirectAnalisiProfittabilitaParser:
         self.file_path = Path(file_path)
         self.workbook = None
         self.ws = None
+        self.sheet_names: List[str] = []
+        self.use_calamine = False  # True when the workbook was opened with python-calamine
+        self.latest_va21_sheet = None  # Resolved once in load_workbook()
         self.va21_offers = {}  # Cache for VA21 offer data
+        self.va21_offers_loaded = False  # True once the VA21 sheet has been scanned for this workbook
+        self.quotation: Optional[IndustrialQuotation] = None  # Result of parse(), reused on later calls
         
     def load_workbook(self) -> None:
-        """Load the Excel workbook"""
+        """Load the Excel workbook (python-calamine when available, openpyxl otherwise)"""
         try:
             logger.info(f"Loading workbook from: {self.file_path}")
-            self.workbook = load_workbook(str(self.file_path), data_only=True)
+            self.use_calamine = False
+            if CALAMINE_AVAILABLE:
+                try:
+                    self.workbook = CalamineWorkbook.from_path(str(self.file_path))
+                    self.sheet_names = list(self.workbook.sheet_names)
+                    self.use_calamine = True
+                except Exception as e:
+                    logger.warning(f"Calamine could not open {self.file_path}, falling back to openpyxl: {e}")
+            
+            if not self.use_calamine:
+                # read_only streams the sheets instead of building the full cell graph;
+                # rows are consumed with a single iter_rows() pass per sheet
+                self.workbook = load_workbook(str(self.file_path), read_only=True, data_only=True, keep_links=False)
+                self.sheet_names = list(self.workbook.sheetnames)
             logger.debug("Workbook loaded successfully")
             
-            if 'NEW_OFFER1' not in self.workbook.sheetnames:
-                error_msg = f"Required worksheet 'NEW_OFFER1' not found in {self.file_path}. Available sheets: {self.workbook.sheetnames}"
+            if 'NEW_OFFER1' not in self.sheet_names:
+                error_msg = f"Required worksheet 'NEW_OFFER1' not found in {self.file_path}. Available sheets: {self.sheet_names}"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
             
-            self.ws = self.workbook['NEW_OFFER1']
-            logger.info(f"Loaded workbook with {self.ws.max_row} rows and {self.ws.max_column} columns")
+            self.ws = self._get_sheet('NEW_OFFER1')
+            self.latest_va21_sheet = self._resolve_latest_va21_sheet()
+            self.va21_offers = {}
+            self.va21_offers_loaded = False
+            logger.info(f"Loaded NEW_OFFER1 with {'calamine' if self.use_calamine else 'openpyxl'}")
             
         except FileNotFoundError as e:
             error_msg = f"File not found: {self.file_path}"
@@ -212,503 +401,423 @@ class DirectAnalisiProfittabilitaParser:
     
     def extract_project_info(self) -> ProjectInfo:
         """Extract project information and create ProjectInfo object"""
+        logger.debug("Extracting project information")
+        
+        if not self.ws:
+            error_msg = "Worksheet not loaded. Call load_workbook() first."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        
+        # Fetch both project info cells in one bounded read (read-only sheets have no cheap
+        # random access); a sheet shorter than the header leaves the missing fields empty
+        project_rows = list(self._iter_sheet_rows(
+            self.ws, ExcelRows.PROJECT_INFO_START,
+            max_row=PROJECT_INFO_MAX_ROW, max_col=PROJECT_INFO_MAX_COL,
+            text_cols=PROJECT_INFO_TEXT_COLUMNS
+        ))
+        values = {
+            field: self._safe_cell_value(project_rows[row_offset], column)
+            if row_offset < len(project_rows) else None
+            for field, row_offset, column in PROJECT_INFO_FIELDS
+        }
+        project_id = str(values['project_id']) if values['project_id'] else ""
+        listino = str(values['listino']) if values['listino'] else None
+        
+        # Parameters and sales info are fixed defaults for AP files
+        parameters = ProjectParameters(
+            doc_percentage=0.00632,  # Default value
+            pm_percentage=0.02061,   # Default value
+            financial_costs=0.0,
+            currency="EUR",          # Default currency
+            exchange_rate=1.0,
+            waste_disposal=0.005,
+            warranty_percentage=0.03,
+            is_24h_service=False
+        )
+        sales_info = SalesInfo(
+            area_manager=None,
+            agent=None,
+            commission_percentage=0.0,
+            author=None
+        )
+        
         try:
-            logger.debug("Extracting project information")
-            
-            if not self.ws:
-                error_msg = "Worksheet not loaded. Call load_workbook() first."
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
-            
-            # Extract basic project info with error handling
-            try:
-                project_id_cell = self.ws.cell(row=ProjectInfoCells.PROJECT_ID[0], column=ProjectInfoCells.PROJECT_ID[1])
-                project_id = str(project_id_cell.value) if project_id_cell.value else ""
-            except Exception as e:
-                logger.warning(f"Error extracting project ID: {e}")
-                project_id = ""
-            
-            try:
-                listino_cell = self.ws.cell(row=ProjectInfoCells.LISTINO[0], column=ProjectInfoCells.LISTINO[1])
-                listino = str(listino_cell.value) if listino_cell.value else None
-            except Exception as e:
-                logger.warning(f"Error extracting listino: {e}")
-                listino = None
-            
-            # Create parameters object with defaults for AP files
-            try:
-                parameters = ProjectParameters(
-                    doc_percentage=0.00632,  # Default value
-                    pm_percentage=0.02061,   # Default value
-                    financial_costs=0.0,
-                    currency="EUR",          # Default currency
-                    exchange_rate=1.0,
-                    waste_disposal=0.005,
-                    warranty_percentage=0.03,
-                    is_24h_service=False
-                )
-            except Exception as e:
-                error_msg = f"Error creating ProjectParameters: {e}"
-                logger.error(error_msg)
-                raise ValueError(error_msg) from e
-            
-            # Create sales info object (defaults for AP files)
-            try:
-                sales_info = SalesInfo(
-                    area_manager=None,
-                    agent=None,
-                    commission_percentage=0.0,
-                    author=None
-                )
-            except Exception as e:
-                error_msg = f"Error creating SalesInfo: {e}"
-                logger.error(error_msg)
-                raise ValueError(error_msg) from e
-            
-            try:
-                project_info = ProjectInfo(
-                    id=project_id,
-                    customer="",  # Not typically available in AP files
-                    listino=listino,
-                    parameters=parameters,
-                    sales_info=sales_info
-                )
-                logger.debug(f"Successfully extracted project info: ID={project_id}")
-                return project_info
-            except Exception as e:
-                error_msg = f"Error creating ProjectInfo: {e}"
-                logger.error(error_msg)
-                raise ValueError(error_msg) from e
-                
-        except RuntimeError as e:
-            # Re-raise runtime errors
-            raise e
+            project_info = ProjectInfo(
+                id=project_id,
+                customer="",  # Not typically available in AP files
+                listino=listino,
+                parameters=parameters,
+                sales_info=sales_info
+            )
         except ValueError as e:
-            # Re-raise value errors
-            raise e
-        except Exception as e:
-            error_msg = f"Unexpected error extracting project info: {e}"
+            # Pydantic's ValidationError is a ValueError
+            error_msg = f"Error creating ProjectInfo: {e}"
             logger.error(error_msg)
-            raise Exception(error_msg) from e
+            raise ValueError(error_msg) from e
+        
+        logger.debug(f"Successfully extracted project info: ID={project_id}")
+        return project_info
     
     def extract_va21_offer_data(self) -> Dict[str, float]:
-        """Extract offer prices from VA21 sheet if available"""
+        """Extract offer prices from VA21 sheet if available.
+        
+        The sheet is streamed once into a dict keyed by WBE and the result is cached for the
+        loaded workbook, so later calls never parse the VA21 XML again.
+        """
+        if not self.workbook:
+            error_msg = "Workbook not loaded. Call load_workbook() first."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        
+        # The VA21 sheet is scanned once per loaded workbook
+        if self.va21_offers_loaded:
+            return self.va21_offers
+        
+        logger.debug("Starting VA21 offer data extraction")
         try:
-            logger.debug("Starting VA21 offer data extraction")
+            va21_sheet_name = self._find_latest_va21_sheet()
+            if not va21_sheet_name:
+                logger.debug("No VA21 sheet found")
+                self.va21_offers = {}
+                self.va21_offers_loaded = True
+                return self.va21_offers
             
-            if not self.workbook:
-                error_msg = "Workbook not loaded. Call load_workbook() first."
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
+            va21_ws = self._get_sheet(va21_sheet_name)
+            logger.debug(f"Processing VA21 sheet: {va21_sheet_name}")
             
-            try:
-                va21_sheet_name = self._find_latest_va21_sheet()
-                if not va21_sheet_name:
-                    logger.debug("No VA21 sheet found")
-                    return {}
-            except Exception as e:
-                error_msg = f"Error finding VA21 sheet: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
+            # Batch-read only the VA21 column window; indices are relative to its first column
+            # and, like the helpers, bound to locals once for the row loop
+            offset = VA21_MIN_COL
+            cod_idx = VA21Columns.COD - offset
+            wbe_idx = VA21Columns.WBE - offset
+            wbe_backup_idx = VA21Columns.WBE_BACKUP - offset
+            description_idx = VA21Columns.DESCRIPTION - offset
+            quantity_idx = VA21Columns.QUANTITY - offset
+            listino_subtotal_idx = VA21Columns.LISTINO_SUBTOTAL - offset
+            discount_idx = VA21Columns.DISCOUNT - offset
+            offer_total_idx = VA21Columns.OFFER_TOTAL - offset
+            cost_subtotal_idx = VA21Columns.COST_SUBTOTAL - offset
+            margin_percentage_idx = VA21Columns.MARGIN_PERCENTAGE - offset
+            row_width = VA21_ROW_WIDTH - offset + 1
+            safe_float = self._safe_float
+            convert_wbe = _convert_wbe_us_to_it_cached  # wbe codes here are always str
             
-            try:
-                va21_ws = self.workbook[va21_sheet_name]
-                logger.debug(f"Processing VA21 sheet: {va21_sheet_name}")
-                
-                offers = {}
-                for row in range(VA21Rows.DATA_START_ROW, va21_ws.max_row + 1):
-                    try:
-                        # Get WBE code (try column D first, then column C as backup)
-                        wbe_primary = va21_ws.cell(row=row, column=VA21Columns.WBE).value
-                        wbe_backup = va21_ws.cell(row=row, column=VA21Columns.WBE_BACKUP).value
-                        wbe_code = wbe_primary if wbe_primary else wbe_backup
-                        cod = va21_ws.cell(row=row, column=VA21Columns.COD).value
-                        description = va21_ws.cell(row=row, column=VA21Columns.DESCRIPTION).value
-                        quantity = va21_ws.cell(row=row, column=VA21Columns.QUANTITY).value
-                        listino_subtotal = va21_ws.cell(row=row, column=VA21Columns.LISTINO_SUBTOTAL).value
-                        discount = va21_ws.cell(row=row, column=VA21Columns.DISCOUNT).value
-                        offer_total = va21_ws.cell(row=row, column=VA21Columns.OFFER_TOTAL).value
-                        cost_subtotal = va21_ws.cell(row=row, column=VA21Columns.COST_SUBTOTAL).value
-                        margin_percentage = va21_ws.cell(row=row, column=VA21Columns.MARGIN_PERCENTAGE).value
-                        
-                        if cod and wbe_code:
-                            try:
-                                wbe_str = str(wbe_code).strip()
-                                # Convert US format to IT format if needed
-                                if wbe_str.endswith(IdentificationPatterns.WBE_US_SUFFIX):
-                                    wbe_str = self._convert_wbe_us_to_it(wbe_str)
-                                
-                                # Ensure offer_total is a valid number
-                                safe_offer_total = self._safe_decimal(offer_total, 0.0)
-                                safe_cost_subtotal = self._safe_decimal(cost_subtotal, 0.0)
-                                safe_listino_subtotal = self._safe_decimal(listino_subtotal, 0.0)
-                                safe_discount = self._safe_decimal(discount, 0.0)
-                                safe_margin_percentage = self._safe_decimal(margin_percentage, 0.0)
-                                
-                                offers[wbe_str] = {
-                                    VA21Columns.WBE: wbe_str,
-                                    VA21Columns.COD: cod,
-                                    VA21Columns.DESCRIPTION: description,
-                                    VA21Columns.QUANTITY: quantity,
-                                    VA21Columns.LISTINO_SUBTOTAL: safe_listino_subtotal,
-                                    VA21Columns.DISCOUNT: safe_discount,
-                                    VA21Columns.OFFER_TOTAL: safe_offer_total,
-                                    VA21Columns.COST_SUBTOTAL: safe_cost_subtotal,
-                                    VA21Columns.MARGIN_PERCENTAGE: safe_margin_percentage
-                                }
-                                logger.debug(f"Extracted VA21 offer: {wbe_str}")
-                                
-                            except Exception as e:
-                                logger.warning(f"Error processing VA21 row {row} data: {e}")
-                                continue
-                                
-                    except Exception as e:
-                        logger.warning(f"Error reading VA21 row {row}: {e}")
+            offers = {}
+            va21_rows = self._stop_at_blank_run(
+                self._iter_sheet_rows(va21_ws, VA21Rows.DATA_START_ROW,
+                                      min_col=VA21_MIN_COL, max_col=VA21_ROW_WIDTH,
+                                      text_cols=VA21_TEXT_COLUMNS),
+                VA21Rows.MAX_BLANK_RUN, va21_sheet_name, VA21Rows.DATA_START_ROW)
+            for row, row_values in enumerate(va21_rows, start=VA21Rows.DATA_START_ROW):
+                try:
+                    if len(row_values) < row_width:
+                        row_values = row_values + (None,) * (row_width - len(row_values))
+                    
+                    # Get WBE code (try column D first, then column C as backup)
+                    cod = row_values[cod_idx]
+                    wbe_code = row_values[wbe_idx] or row_values[wbe_backup_idx]
+                    if not (cod and wbe_code):
                         continue
-                
-                logger.debug(f"Extracted {len(offers)} offer prices from VA21 sheet")
-                return offers
-                
-            except KeyError as e:
-                error_msg = f"VA21 sheet '{va21_sheet_name}' not found in workbook: {e}"
-                logger.error(error_msg)
-                raise KeyError(error_msg) from e
-            except Exception as e:
-                error_msg = f"Error processing VA21 sheet '{va21_sheet_name}': {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
-                
-        except RuntimeError as e:
-            # Re-raise runtime errors
-            raise e
-        except KeyError as e:
-            # Re-raise key errors
-            raise e
-        except Exception as e:
-            error_msg = f"Unexpected error extracting VA21 offer data: {e}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+                    
+                    # Convert US format to IT format (no-op for other codes)
+                    wbe_str = convert_wbe(str(wbe_code).strip())
+                    offers[wbe_str] = {
+                        VA21Columns.WBE: wbe_str,
+                        VA21Columns.COD: cod,
+                        VA21Columns.DESCRIPTION: row_values[description_idx],
+                        VA21Columns.QUANTITY: row_values[quantity_idx],
+                        VA21Columns.LISTINO_SUBTOTAL: safe_float(row_values[listino_subtotal_idx]),
+                        VA21Columns.DISCOUNT: safe_float(row_values[discount_idx]),
+                        VA21Columns.OFFER_TOTAL: safe_float(row_values[offer_total_idx]),
+                        VA21Columns.COST_SUBTOTAL: safe_float(row_values[cost_subtotal_idx]),
+                        VA21Columns.MARGIN_PERCENTAGE: safe_float(row_values[margin_percentage_idx])
+                    }
+                except Exception as e:
+                    logger.warning(f"Error reading VA21 row {row}: {e}")
+                    continue
+            
+            # Only the offers are kept; drop the sheet so its rows can be released
+            del va21_rows, va21_ws
+            
+            logger.debug(f"Extracted {len(offers)} offer prices from VA21 sheet")
+            self.va21_offers = offers
+            self.va21_offers_loaded = True
+            return offers
+            
+        except Exception:
+            # Keep the original exception type and traceback for the caller
+            logger.exception("Error extracting VA21 offer data")
+            raise
     
     def extract_product_groups(self) -> List[ProductGroup]:
         """Extract product groups, categories, and items directly as model objects"""
         try:
-            logger.debug("Starting product groups extraction")
-            
-            if not self.ws:
-                error_msg = "Worksheet not loaded. Call load_workbook() first."
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
-            
-            # First extract VA21 offer data
-            try:
-                self.va21_offers = self.extract_va21_offer_data()
-            except Exception as e:
-                logger.warning(f"Error extracting VA21 offers, continuing without them: {e}")
-                self.va21_offers = {}
-            
-            product_groups: List[ProductGroup] = []
-            current_group = None
-            current_category = None
-            
-            # Start from data start row
+            product_groups = list(self.iter_product_groups())
+        except RuntimeError:
+            raise
+        except Exception:
+            # Keep the original exception type and traceback for the caller
+            logger.exception("Error extracting product groups")
+            raise
+        
+        # One summary line instead of per-row logging
+        category_count = sum(len(group.categories) for group in product_groups)
+        item_count = sum(len(category.items) for group in product_groups for category in group.categories)
+        logger.info("Extracted %d product groups, %d categories, %d items",
+                    len(product_groups), category_count, item_count)
+        return product_groups
+    
+    def iter_product_groups(self) -> Iterator[ProductGroup]:
+        """Yield product groups one at a time as each is completed in the NEW_OFFER1 sweep.
+        
+        A group is yielded when the next group header is read, so only the group being built is
+        held in memory. The VA21 group of unmatched offers, if any, is yielded last.
+        """
+        if not self.ws:
+            error_msg = "Worksheet not loaded. Call load_workbook() first."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        
+        logger.debug("Starting product groups extraction")
+        
+        # First extract VA21 offer data. This stays on the calling thread: the workbook handle
+        # cannot be shared across threads and a second handle re-parses the whole file,
+        # which costs far more than the (small) VA21 sweep it would overlap with
+        try:
+            self.va21_offers = self.extract_va21_offer_data()
+        except Exception as e:
+            logger.warning(f"Error extracting VA21 offers, continuing without them: {e}")
+            self.va21_offers = {}
+        
+        current_group = None
+        current_category = None
+        existing_wbes = set()  # WBE codes of the categories created from NEW_OFFER1
+        
+        # Bind 0-based column indices and helpers to locals for the row loop
+        priority_idx = ExcelColumns.PRIORITY - 1
+        cod_idx = ExcelColumns.COD - 1
+        codice_idx = ExcelColumns.CODICE - 1
+        denominazione_idx = ExcelColumns.DENOMINAZIONE - 1
+        qta_idx = ExcelColumns.QTA - 1
+        wbe_idx = ExcelColumns.WBE - 1
+        sub_tot_listino_idx = ExcelColumns.SUB_TOT_LISTINO - 1
+        subtot_costo_idx = ExcelColumns.SUBTOT_COSTO - 1
+        costo_totale_idx = ExcelColumns.COSTO_TOTALE - 1
+        position_idx = ExcelColumns.POSITION - 1
+        priority_order_idx = ExcelColumns.PRIORITY_ORDER - 1
+        data_row_width = DATA_ROW_WIDTH
+        item_numeric_fields = ITEM_NUMERIC_FIELDS
+        item_text_fields = ITEM_TEXT_FIELDS
+        to_float = _to_float
+        safe_float = self._safe_float
+        classify_row = self._classify_row
+        fill_item_totals = self._fill_item_totals
+        safe_int = self._safe_int
+        build_item = QuotationItem.model_construct
+        va21_offers = self.va21_offers
+        offer_total_key = VA21Columns.OFFER_TOTAL
+        kind_group, kind_category, kind_item = RowKind.GROUP, RowKind.CATEGORY, RowKind.ITEM
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)  # Gate per-row debug logging
+        
+        # Single pass over the data rows, starting from the data start row
+        # Only the columns the parser reads are decoded; later columns are never touched
+        data_rows = self._stop_at_blank_run(
+            self._iter_sheet_rows(self.ws, ExcelRows.DATA_START_ROW, max_col=data_row_width,
+                                 key_col=ExcelColumns.PRIORITY, text_cols=DATA_TEXT_COLUMNS),
+            ExcelRows.MAX_BLANK_RUN, 'NEW_OFFER1', ExcelRows.DATA_START_ROW)
+        row = ExcelRows.DATA_START_ROW - 1  # Last row read, for the row count log
+        for row, row_values in enumerate(data_rows, start=ExcelRows.DATA_START_ROW):
             try:
-                for row in range(ExcelRows.DATA_START_ROW, self.ws.max_row + 1):
-                    try:
-                        # Skip row if no priority value
-                        priority_val = self._safe_cell_value(row, ExcelColumns.PRIORITY)
-                        if not priority_val:
-                            continue
-                        
-                        # Extract basic identification values
-                        cod_val = self._safe_cell_value(row, ExcelColumns.COD)
-                        codice_val = self._safe_cell_value(row, ExcelColumns.CODICE)
-                        denominazione_val = self._safe_cell_value(row, ExcelColumns.DENOMINAZIONE)
-                        qta_val = self._safe_cell_value(row, ExcelColumns.QTA)
-                        wbe_val = self._safe_cell_value(row, ExcelColumns.WBE)
+                # Pad short rows so fields can be indexed directly
+                if len(row_values) < data_row_width:
+                    row_values = row_values + (None,) * (data_row_width - len(row_values))
+                
+                # Skip row if no priority value
+                if not row_values[priority_idx]:
+                    continue
+                
+                # Extract basic identification values
+                cod_val = row_values[cod_idx]
+                codice_val = row_values[codice_idx]
+                denominazione_val = row_values[denominazione_idx]
+                qta_val = row_values[qta_idx]
+                wbe_val = row_values[wbe_idx]
 
-                        # Check if this is a group header (TXT in CODICE)
-                        if codice_val and str(codice_val).startswith(IdentificationPatterns.GROUP_PREFIX):
-                            try:
-                                # Save previous group if exists
-                                if current_group:
-                                    product_groups.append(current_group)
-                                
-                                # Start new group
-                                current_group = ProductGroup(
-                                    group_id=str(codice_val),
-                                    group_name=str(denominazione_val) if denominazione_val else "",
-                                    quantity=self._safe_int(qta_val, 1),
-                                    categories=[]
-                                )
-                                current_category = None
-                                logger.debug(f"Found group: {codice_val}")
-                            except Exception as e:
-                                logger.error(f"Error creating product group for row {row}: {e}")
-                                continue
-                                
-                        # Check if this is a category (4-char code in COD column)
-                        elif cod_val and len(str(cod_val).strip()) == IdentificationPatterns.CATEGORY_CODE_LENGTH and current_group:
-                            try:
-                                # Get offer price from VA21 if available
-                                wbe_code = str(wbe_val) if wbe_val else ""
-                                offer_price = self.va21_offers.get(wbe_code, {}).get(VA21Columns.OFFER_TOTAL, 0.0)
-                                
-                                # Calculate cost value safely
-                                cost_value = float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SUBTOT_COSTO)))
-                                
-                                # Calculate margin safely, handling None offer_price
-                                margin_amount = (offer_price - cost_value) if offer_price is not None else 0.0
-                                
-                                # Calculate margin percentage safely
-                                margin_percentage = (
-                                    ((offer_price - cost_value) / cost_value * 100)
-                                    if offer_price is not None and cost_value != 0
-                                    else 0.0
-                                )
-                                
-                                current_category = QuotationCategory(
-                                    category_id=str(cod_val),
-                                    category_name=str(denominazione_val) if denominazione_val else "",
-                                    wbe=wbe_code,
-                                    items=[],
-                                    pricelist_subtotal=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SUB_TOT_LISTINO))),
-                                    cost_subtotal=cost_value,
-                                    total_cost=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.COSTO_TOTALE))),
-                                    offer_price=offer_price,
-                                    margin_amount=margin_amount,
-                                    margin_percentage=margin_percentage
-                                )
-                                current_group.categories.append(current_category)
-                                logger.debug(f"Found category: {current_category.category_id} - \
-                                    list {safe_format_number(current_category.pricelist_subtotal,0)} - \
-                                    cost {safe_format_number(current_category.cost_subtotal,0)} - \
-                                    offer {safe_format_number(current_category.offer_price,0)} - \
-                                    margin {safe_format_number(current_category.margin_amount,0)}")
-                            except Exception as e:
-                                logger.error(f"Error creating category for row {row}: {e}")
-                                continue
-                                
-                        # Check if this is an item
-                        elif (denominazione_val and current_category 
-                              and not (codice_val and str(codice_val).startswith(IdentificationPatterns.GROUP_PREFIX))
-                              and not (cod_val and len(str(cod_val).strip()) == IdentificationPatterns.CATEGORY_CODE_LENGTH)
-                              and str(denominazione_val) != "DENOMINAZIONE"):  # Skip header row
-                            
-                            try:
-                                # Extract all item fields including engineering costs
-                                item = QuotationItem(
-                                    position=str(self._safe_cell_value(row, ExcelColumns.POSITION, row)),
-                                    code=str(codice_val) if codice_val else "",
-                                    cod_listino=str(self._safe_cell_value(row, ExcelColumns.COD_LISTINO, "")),
-                                    description=str(denominazione_val),
-                                    quantity=float(self._safe_decimal(qta_val)),
-                                    pricelist_unit_price=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.LIST_UNIT))),
-                                    pricelist_total_price=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.LISTINO_TOTALE))),
-                                    unit_cost=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.COSTO_UNITARIO))),
-                                    total_cost=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.COSTO_TOTALE))),
-                                    internal_code=str(self._safe_cell_value(row, ExcelColumns.COD_2, "")),
-                                    priority_order=int(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.PRIORITY_ORDER, 0))),
-                                    
-                                    # Engineering and manufacturing costs
-                                    utm_robot=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_ROBOT))),
-                                    utm_robot_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_ROBOT_H))),
-                                    utm_lgv=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_LGV))),
-                                    utm_lgv_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_LGV_H))),
-                                    utm_intra=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_INTRA))),
-                                    utm_intra_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_INTRA_H))),
-                                    utm_layout=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_LAYOUT))),
-                                    utm_layout_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTM_LAYOUT_H))),
-                                    
-                                    # Engineering costs
-                                    ute=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTE))),
-                                    ute_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.UTE_H))),
-                                    ba=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.BA))),
-                                    ba_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.BA_H))),
-                                    sw_pc=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SW_PC))),
-                                    sw_pc_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SW_PC_H))),
-                                    sw_plc=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SW_PLC))),
-                                    sw_plc_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SW_PLC_H))),
-                                    sw_lgv=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SW_LGV))),
-                                    sw_lgv_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SW_LGV_H))),
-                                    
-                                    # Manufacturing costs  
-                                    mtg_mec=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.MTG_MEC))),
-                                    mtg_mec_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.MTG_MEC_H))),
-                                    mtg_mec_intra=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.MTG_MEC_INTRA))),
-                                    mtg_mec_intra_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.MTG_MEC_INTRA_H))),
-                                    cab_ele=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.CAB_ELE))),
-                                    cab_ele_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.CAB_ELE_H))),
-                                    cab_ele_intra=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.CAB_ELE_INTRA))),
-                                    cab_ele_intra_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.CAB_ELE_INTRA_H))),
-                                    
-                                    # Testing and field costs
-                                    site=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SITE))),
-                                    site_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.SITE_H))),
-                                    install=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.INSTALL))),
-                                    install_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.INSTALL_H))),
-                                    
-                                    # Additional costs
-                                    pm_cost=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.PM_COST))),
-                                    pm_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.PM_H))),
-                                    document=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.DOCUMENT))),
-                                    document_h=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.DOCUMENT_H))),
-                                    after_sales=float(self._safe_decimal(self._safe_cell_value(row, ExcelColumns.AFTER_SALES)))
-                                )
-                                
-                                current_category.items.append(item)
-                                logger.debug(f"Found item: {codice_val}")
-                            except Exception as e:
-                                logger.error(f"Error creating item for row {row}: {e}")
-                                continue
+                # Classify the row once, then dispatch on its kind
+                row_kind = classify_row(cod_val, codice_val, denominazione_val)
+                
+                # Check if this is a group header (TXT in CODICE)
+                if row_kind is kind_group:
+                    # The previous group is complete once the next header is seen
+                    if current_group:
+                        yield current_group
+                    
+                    # Start new group
+                    current_group = ProductGroup(
+                        group_id=str(codice_val),
+                        group_name=str(denominazione_val) if denominazione_val else "",
+                        quantity=safe_int(qta_val, 1),
+                        categories=[]
+                    )
+                    current_category = None
+                    if debug_enabled:
+                        logger.debug("Found group: %s", codice_val)
                         
-                    except Exception as e:
-                        logger.error(f"Error processing row {row}: {e}")
-                        continue
+                # Check if this is a category (4-char code in COD column)
+                elif row_kind is kind_category and current_group:
+                    # Get offer price from VA21 if available
+                    wbe_code = str(wbe_val) if wbe_val else ""
+                    offer_price = va21_offers.get(wbe_code, {}).get(offer_total_key, 0.0)
+                    
+                    # Read the cost subtotal once; it feeds the subtotal and both margin figures
+                    cost_value = safe_float(row_values[subtot_costo_idx])
+                    
+                    # Calculate margin safely, handling None offer_price
+                    margin_amount = (offer_price - cost_value) if offer_price is not None else 0.0
+                    
+                    # Calculate margin percentage safely, reusing the margin amount
+                    margin_percentage = (
+                        (margin_amount / cost_value * 100)
+                        if offer_price is not None and cost_value != 0
+                        else 0.0
+                    )
+                    
+                    current_category = QuotationCategory(
+                        category_id=str(cod_val),
+                        category_name=str(denominazione_val) if denominazione_val else "",
+                        wbe=wbe_code,
+                        items=[],
+                        pricelist_subtotal=safe_float(row_values[sub_tot_listino_idx]),
+                        cost_subtotal=cost_value,
+                        total_cost=safe_float(row_values[costo_totale_idx]),
+                        offer_price=offer_price,
+                        margin_amount=margin_amount,
+                        margin_percentage=margin_percentage
+                    )
+                    current_group.categories.append(current_category)
+                    if wbe_code:
+                        existing_wbes.add(wbe_code)
+                    if debug_enabled:
+                        logger.debug("Found category: %s - list %s - cost %s - offer %s - margin %s",
+                                     current_category.category_id,
+                                     safe_format_number(current_category.pricelist_subtotal, 0),
+                                     safe_format_number(current_category.cost_subtotal, 0),
+                                     safe_format_number(current_category.offer_price, 0),
+                                     safe_format_number(current_category.margin_amount, 0))
                         
+                # Check if this is an item
+                elif row_kind is kind_item and current_category:
+                    # Decode all numeric item fields (including engineering costs) from the row tuple
+                    # Float cells (the common case) are taken as-is and empty cells become 0.0;
+                    # only the rest go through _to_float
+                    item_fields = {}
+                    for name, index in item_numeric_fields:
+                        value = row_values[index]
+                        if type(value) is not float:
+                            value = 0.0 if value is None else to_float(value)
+                        item_fields[name] = value
+                    fill_item_totals(item_fields)
+                    for name, index in item_text_fields:
+                        value = row_values[index]
+                        item_fields[name] = str(value) if value is not None else ""
+                    position_val = row_values[position_idx]
+                    # Values are already coerced above, so skip Pydantic validation per item
+                    item = build_item(
+                        position=str(position_val if position_val is not None else row),
+                        code=str(codice_val) if codice_val else "",
+                        description=str(denominazione_val),
+                        priority_order=int(to_float(row_values[priority_order_idx])),
+                        **item_fields
+                    )
+                    
+                    current_category.items.append(item)
+                    if debug_enabled:
+                        logger.debug("Found item: %s", codice_val)
+                
             except Exception as e:
-                error_msg = f"Error iterating through worksheet rows: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
-            
-            # Add the last group if exists
-            try:
-                if current_group:
-                    product_groups.append(current_group)
-            except Exception as e:
-                logger.error(f"Error adding final group: {e}")
-            
-            # Create VA21 group for unmatched items  
+                logger.error(f"Error processing row {row}: {e}")
+                continue
+        
+        # Yield the last group if exists
+        if current_group:
+            yield current_group
+        
+        # Create VA21 group for unmatched items
+        va21_group = ProductGroup(
+            group_id="VA21",
+            group_name="VA21",
+            quantity=1,
+            categories=[]
+        )
+
+        # Create VA21 category and add unmatched items
+        for wbe, offer_data in va21_offers.items():
+            if wbe in existing_wbes:
+                continue
             try:
-                va21_group = ProductGroup(
-                    group_id="VA21",
-                    group_name="VA21",
-                    quantity=1,
-                    categories=[]
+                get_offer_value = offer_data.get
+                cost_subtotal = get_offer_value(VA21Columns.COST_SUBTOTAL, 0.0)
+                offer_total = get_offer_value(VA21Columns.OFFER_TOTAL, 0.0)
+                item = QuotationCategory(
+                    category_id=get_offer_value(VA21Columns.COD, ''),
+                    category_name=get_offer_value(VA21Columns.DESCRIPTION, ''),
+                    quantity=get_offer_value(VA21Columns.QUANTITY, 0.0),
+                    pricelist_subtotal=get_offer_value(VA21Columns.LISTINO_SUBTOTAL, 0.0),
+                    cost_subtotal=cost_subtotal,
+                    total_cost=cost_subtotal,
+                    margin_amount=offer_total - cost_subtotal,
+                    margin_percentage=get_offer_value(VA21Columns.MARGIN_PERCENTAGE, 0.0),
+                    offer_price=offer_total,
+                    wbe=wbe
                 )
                 
-                # Create a set of all WBE codes from existing categories
-                existing_wbes = set()
-                for group in product_groups:
-                    for category in group.categories:
-                        if category.wbe:
-                            existing_wbes.add(category.wbe)
-
-                # Create VA21 category and add unmatched items
-                if self.va21_offers:
-                    for wbe, offer_data in self.va21_offers.items():
-                        try:
-                            if wbe not in existing_wbes:
-                                item = QuotationCategory(
-                                    category_id=offer_data.get(VA21Columns.COD, ''),
-                                    category_name=offer_data.get(VA21Columns.DESCRIPTION, ''),
-                                    quantity=offer_data.get(VA21Columns.QUANTITY, 0.0),
-                                    pricelist_subtotal=offer_data.get(VA21Columns.LISTINO_SUBTOTAL, 0.0),
-                                    cost_subtotal=offer_data.get(VA21Columns.COST_SUBTOTAL, 0.0),
-                                    total_cost=offer_data.get(VA21Columns.COST_SUBTOTAL, 0.0),
-                                    margin_amount=offer_data.get(VA21Columns.OFFER_TOTAL, 0.0) - offer_data.get(VA21Columns.COST_SUBTOTAL, 0.0),
-                                    margin_percentage=offer_data.get(VA21Columns.MARGIN_PERCENTAGE, 0.0),
-                                    offer_price=offer_data.get(VA21Columns.OFFER_TOTAL, 0.0),
-                                    wbe=wbe
-                                )
-                                
-                                va21_group.categories.append(item)
-                                logger.debug(f"Added VA21 category: {item.category_id} - \
-                                    list {safe_format_number(item.pricelist_subtotal,0)} - \
-                                    cost {safe_format_number(item.cost_subtotal,0)} - \
-                                    offer {safe_format_number(item.offer_price,0)} - \
-                                    margin {safe_format_number(item.margin_amount,0)}")
-                        except Exception as e:
-                            logger.error(f"Error creating VA21 category for WBE {wbe}: {e}")
-                            continue
-                
-                # Only add VA21 group if it has categories
-                if va21_group.categories:
-                    product_groups.append(va21_group)
-                    
+                va21_group.categories.append(item)
+                if debug_enabled:
+                    logger.debug("Added VA21 category: %s - list %s - cost %s - offer %s - margin %s",
+                                 item.category_id,
+                                 safe_format_number(item.pricelist_subtotal, 0),
+                                 safe_format_number(item.cost_subtotal, 0),
+                                 safe_format_number(item.offer_price, 0),
+                                 safe_format_number(item.margin_amount, 0))
             except Exception as e:
-                logger.error(f"Error processing VA21 offers: {e}")
-            
-            logger.debug(f"Successfully extracted {len(product_groups)} product groups")
-            return product_groups
-            
-        except RuntimeError as e:
-            # Re-raise runtime errors
-            raise e
-        except Exception as e:
-            error_msg = f"Unexpected error extracting product groups: {e}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+                logger.error(f"Error creating VA21 category for WBE {wbe}: {e}")
+                continue
+        
+        # Only yield VA21 group if it has categories
+        if va21_group.categories:
+            yield va21_group
+        
+        logger.debug("Read %d rows from NEW_OFFER1", row - ExcelRows.DATA_START_ROW + 1)
     
-    def calculate_totals(self, product_groups: List[ProductGroup], parameters: ProjectParameters) -> QuotationTotals:
-        """Calculate total costs and fees"""
+    def calculate_totals(self, product_groups: List[ProductGroup]) -> QuotationTotals:
+        """Calculate total costs and fees (AP totals depend only on the category subtotals)"""
+        logger.debug("Calculating totals")
         try:
-            logger.debug("Calculating totals")
-            
-            total_pricelist = Decimal("0.0")
-            total_cost = Decimal("0.0")
-            total_offer = Decimal("0.0")
-            offer_margin = Decimal("0.0")
-            offer_margin_percentage = Decimal("0.0")
-            
-            # Sum up costs from all categories
-            try:
-                for group in product_groups:
-                    try:
-                        for category in group.categories:
-                            try:
-                                # Use offer_price if available, otherwise pricelist_subtotal
-                                category_pricelist = Decimal(str(category.pricelist_subtotal)) if category.pricelist_subtotal is not None else Decimal("0.0")
-                                category_cost = Decimal(str(category.cost_subtotal)) if category.cost_subtotal is not None else Decimal("0.0")
-                                category_offer = Decimal(str(category.offer_price)) if category.offer_price is not None else Decimal("0.0")
-                                category_margin = Decimal(str(category.margin_amount)) if category.margin_amount is not None else Decimal("0.0")
-
-                                total_pricelist += category_pricelist
-                                total_cost += category_cost
-                                total_offer += category_offer
-                                offer_margin += category_margin
-                                
-                            except Exception as e:
-                                logger.warning(f"Error processing category {category.category_id} in group {group.group_id}: {e}")
-                                continue
-                                
-                    except Exception as e:
-                        logger.warning(f"Error processing group {group.group_id}: {e}")
-                        continue
-                        
-            except Exception as e:
-                error_msg = f"Error iterating through product groups: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
+            # Sum up costs from all categories with a single vectorized reduction (floats;
+            # Decimal is only used for the final rounding)
+            categories = [category for group in product_groups for category in group.categories]
+            total_pricelist, total_cost, total_offer, offer_margin = self._sum_category_fields(
+                categories, TOTALS_CATEGORY_FIELDS)
             
             # Calculate margin percentage safely
-            try:
-                if total_cost != 0:
-                    offer_margin_percentage = (offer_margin / total_cost) * 100
-                else:
-                    offer_margin_percentage = Decimal("0.0")
-                    logger.warning("Total cost is zero, setting margin percentage to 0")
-            except Exception as e:
-                logger.warning(f"Error calculating margin percentage: {e}")
-                offer_margin_percentage = Decimal("0.0")
+            if total_cost != 0:
+                offer_margin_percentage = (offer_margin / total_cost) * 100
+            else:
+                offer_margin_percentage = 0.0
+                logger.warning("Total cost is zero, setting margin percentage to 0")
+            
+            totals = QuotationTotals(
+                total_pricelist=self._round_float(total_pricelist),
+                total_cost=self._round_float(total_cost),
+                total_offer=self._round_float(total_offer),
+                offer_margin=self._round_float(offer_margin),
+                offer_margin_percentage=self._round_float(offer_margin_percentage)
+            )
+            logger.debug(f"Calculated totals: pricelist={totals.total_pricelist}, cost={totals.total_cost}, offer={totals.total_offer}")
+            return totals
             
-            try:
-                totals = QuotationTotals(
-                    total_pricelist=float(self._round_decimal(total_pricelist)),
-                    total_cost=float(self._round_decimal(total_cost)),
-                    total_offer=float(self._round_decimal(total_offer)),
-                    offer_margin=float(self._round_decimal(offer_margin)),
-                    offer_margin_percentage=float(self._round_decimal(offer_margin_percentage))
-                )
-                logger.debug(f"Calculated totals: pricelist={totals.total_pricelist}, cost={totals.total_cost}, offer={totals.total_offer}")
-                return totals
-                
-            except Exception as e:
-                error_msg = f"Error creating QuotationTotals object: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
-                
         except Exception as e:
-            error_msg = f"Unexpected error calculating totals: {e}"
+            error_msg = f"Error calculating totals: {e}"
             logger.error(error_msg)
             raise Exception(error_msg) from e
     
@@ -718,164 +827,232 @@ class DirectAnalisiProfittabilitaParser:
             self.workbook.close()
             self.workbook = None
             self.ws = None
+            self.sheet_names = []
+            self.latest_va21_sheet = None
+            self.va21_offers = {}
+            self.va21_offers_loaded = False
+
+    def __enter__(self) -> 'DirectAnalisiProfittabilitaParser':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Read-only workbooks keep the zip file open until closed
+        self.close()
 
     def parse(self) -> IndustrialQuotation:
-        """Main parsing method - returns IndustrialQuotation object directly"""
+        """Main parsing method - returns IndustrialQuotation object directly (parsed once per parser)"""
+        if self.quotation is not None:
+            return self.quotation
+        
+        logger.info(f"Starting direct parsing of Analisi Profittabilita file: {self.file_path}")
         try:
-            logger.info(f"Starting direct parsing of Analisi Profittabilita file: {self.file_path}")
-            
-            try:
-                self.load_workbook()
-            except Exception as e:
-                error_msg = f"Failed to load workbook: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
+            self.load_workbook()
             
             # Extract all sections as model objects
-            try:
-                project_info = self.extract_project_info()
-            except Exception as e:
-                error_msg = f"Failed to extract project info: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
-            
-            try:
-                product_groups = self.extract_product_groups()
-            except Exception as e:
-                error_msg = f"Failed to extract product groups: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
+            project_info = self.extract_project_info()
+            product_groups = self.extract_product_groups()
             
-            try:
-                totals = self.calculate_totals(product_groups, project_info.parameters)
-            except Exception as e:
-                error_msg = f"Failed to calculate totals: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
+            # Everything below works on the extracted models only; release the workbook now
+            # rather than holding it (and its shared strings) through model construction
+            self.close()
+            totals = self.calculate_totals(product_groups)
             
             # Create final IndustrialQuotation object
-            try:
-                quotation = IndustrialQuotation(
-                    project=project_info,
-                    product_groups=product_groups,
-                    totals=totals,
-                    source_file=str(self.file_path),
-                    parser_type=ParserType.ANALISI_PROFITTABILITA_PARSER
-                )
-                
-                logger.info(f"Direct parsing completed. Found {len(product_groups)} product groups")
-                return quotation
-                
-            except Exception as e:
-                error_msg = f"Failed to create IndustrialQuotation object: {e}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
-                
+            quotation = IndustrialQuotation(
+                project=project_info,
+                product_groups=product_groups,
+                totals=totals,
+                source_file=str(self.file_path),
+                parser_type=ParserType.ANALISI_PROFITTABILITA_PARSER
+            )
+            
+            logger.info(f"Direct parsing completed. Found {len(product_groups)} product groups")
+            self.quotation = quotation
+            return quotation
+            
         except Exception as e:
-            error_msg = f"Unexpected error during parsing: {e}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+            # Each step logs its own failure; propagate the original exception unchanged
+            logger.error(f"Direct parsing of {self.file_path} failed: {e}")
+            raise
         finally:
-            # Always close the workbook to release file handles
+            # Always close the workbook to release file handles (no-op if already closed)
             try:
                 self.close()
             except Exception as e:
                 logger.warning(f"Error closing workbook: {e}")
     
     # Helper methods
-    def _safe_cell_value(self, row: int, column: int, default: Any = None) -> Any:
-        """Safely extract cell value by row and column index"""
-        try:
-            cell_value = self.ws.cell(row=row, column=column).value
-            return cell_value if cell_value is not None else default
-        except Exception:
-            return default
+    def _get_sheet(self, sheet_name: str) -> Any:
+        """Return the sheet for sheet_name: an openpyxl worksheet, or its row lists with calamine"""
+        if self.use_calamine:
+            # Calamine decodes a whole sheet per call, so read it once here and let every
+            # sweep over this sheet (project info, data rows) reuse the same row lists
+            return self.workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        ws = self.workbook[sheet_name]
+        # Read-only sheets otherwise trust the stored <dimension>, which some writers leave stale
+        # (truncating rows) or oversized (padding with empty rows); the blank-run stop bounds reads instead
+        ws.reset_dimensions()
+        return ws
     
-    def _safe_decimal(self, value: Any, default: Decimal = None) -> Decimal:
-        """Safely convert value to Decimal"""
-        if value is None or value == "":
-            return default if default is not None else Decimal("0.0")
+    def _iter_sheet_rows(self, ws: Any, min_row: int, max_row: Optional[int] = None,
+                         min_col: int = 1, max_col: Optional[int] = None, key_col: Optional[int] = None,
+                         text_cols: tuple = ()):
+        """Yield row value tuples from min_row (1-based) over columns min_col..max_col, in openpyxl values_only form.
         
-        try:
-            # Convert to string and clean up
-            str_value = str(value).strip()
-            
-            # Handle empty strings after stripping
-            if not str_value:
-                return default if default is not None else Decimal("0.0")
-            
-            # Handle common non-numeric values
-            if str_value.lower() in ['n/a', 'na', 'null', 'none', '-', '']:
-                return default if default is not None else Decimal("0.0")
-                
-            # Remove currency symbols and common formatting
-            str_value = str_value.replace('€', '').replace('$', '').replace(',', '').strip()
-            
-            # Handle percentage notation
-            if str_value.endswith('%'):
-                str_value = str_value[:-1]
-                return Decimal(str_value) / Decimal("100")
-            
-            return Decimal(str_value)
-            
-        except (ValueError, TypeError, decimal.InvalidOperation) as e:
-            logger.debug(f"Could not convert '{value}' to Decimal: {e}")
-            return default if default is not None else Decimal("0.0")
+        If key_col is given, rows with an empty key cell are skipped by the caller and may be yielded
+        without normalization (calamine only). Integral floats in text_cols are yielded as int,
+        as openpyxl reports them; numeric columns keep calamine's floats.
+        """
+        if not self.use_calamine:
+            yield from ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col,
+                                    values_only=True)
+            return
+        
+        # Calamine returns '' for empty cells; those become None as in openpyxl
+        empty_rows = {}
+        key_index = key_col - min_col if key_col is not None else -1
+        text_indexes = [column - min_col for column in text_cols
+                        if column >= min_col and (max_col is None or column <= max_col)]
+        for row_values in islice(ws, min_row - 1, max_row):
+            row_values = row_values[min_col - 1:max_col]
+            width = len(row_values)
+            if row_values.count('') == width:
+                # Blank rows skip the per-cell normalization entirely
+                empty_row = empty_rows.get(width)
+                if empty_row is None:
+                    empty_row = empty_rows[width] = (None,) * width
+                yield empty_row
+                continue
+            if 0 <= key_index < width and row_values[key_index] == '':
+                # The caller skips rows without a key value, so their cells are not normalized
+                yield tuple(row_values)
+                continue
+            row_values = [None if value == '' else value for value in row_values]
+            for index in text_indexes:
+                if index < width:
+                    value = row_values[index]
+                    if type(value) is float and value.is_integer():
+                        row_values[index] = int(value)
+            yield tuple(row_values)
+    
+    def _stop_at_blank_run(self, rows, max_blank_run: int, sheet_name: str, start_row: int):
+        """Pass rows through until max_blank_run consecutive all-empty rows are seen"""
+        blank_run = 0
+        for row, row_values in enumerate(rows, start=start_row):
+            if row_values.count(None) == len(row_values):
+                blank_run += 1
+                if blank_run >= max_blank_run:
+                    logger.warning(f"Stopped reading sheet {sheet_name} at row {row} after {blank_run} "
+                                   f"consecutive blank rows; any data below row {row} is ignored")
+                    return
+            else:
+                blank_run = 0
+            yield row_values
+    
+    def _classify_row(self, cod_val: Any, codice_val: Any, denominazione_val: Any) -> str:
+        """Classify a NEW_OFFER1 row as group, category, item or skip with one str() per cell"""
+        # Slice equality against the fixed-length prefix is cheaper than startswith()
+        if codice_val and str(codice_val)[:GROUP_PREFIX_LENGTH] == GROUP_PREFIX:
+            return RowKind.GROUP
+        if cod_val:
+            # Length first: only codes of the exact length with no edge whitespace skip strip()
+            cod_str = str(cod_val)
+            cod_length = len(cod_str)
+            if cod_length == CATEGORY_CODE_LENGTH:
+                if not (cod_str[0].isspace() or cod_str[-1].isspace()):
+                    return RowKind.CATEGORY
+            elif cod_length > CATEGORY_CODE_LENGTH and len(cod_str.strip()) == CATEGORY_CODE_LENGTH:
+                return RowKind.CATEGORY
+        if denominazione_val and str(denominazione_val) != HEADER_DESCRIPTION:  # Skip header row
+            return RowKind.ITEM
+        return RowKind.SKIP
+    
+    def _fill_item_totals(self, item_fields: Dict[str, Any]) -> None:
+        """Default empty item totals to quantity x unit value, as QuotationItem's validators do"""
+        quantity = item_fields['quantity']
+        if item_fields['pricelist_total_price'] == 0.0:
+            expected = quantity * item_fields['pricelist_unit_price']
+            if expected > 0:
+                item_fields['pricelist_total_price'] = expected
+        if item_fields['total_cost'] == 0.0:
+            expected = quantity * item_fields['unit_cost']
+            if expected > 0:
+                item_fields['total_cost'] = expected
+    
+    def _safe_cell_value(self, row_values: tuple, column: int, default: Any = None) -> Any:
+        """Safely extract cell value from a row tuple by 1-based column index"""
+        # Rows can be shorter than the column asked for; a bounds check avoids raising for those
+        if 0 < column <= len(row_values):
+            cell_value = row_values[column - 1]
+            if cell_value is not None:
+                return cell_value
+        return default
+    
+    def _safe_float(self, value: Any, default: float = 0.0) -> float:
+        """Safely convert value to float (numbers pass straight through)"""
+        return _to_float(value, default)
     
     def _safe_int(self, value: Any, default: int = 0) -> int:
         """Safely convert value to int"""
         if value is None:
             return default
+        # Numeric cells convert directly; only strings need the float() parse
+        value_type = type(value)
+        if value_type is int:
+            return value
         try:
+            if value_type is float or value_type is bool:
+                return int(value)  # NaN still raises ValueError and falls back to default
             return int(float(value))  # Convert via float to handle decimal values
         except (ValueError, TypeError):
             return default
     
+    def _sum_category_fields(self, categories: List[QuotationCategory], fields: tuple) -> List[float]:
+        """Sum numeric category fields in one NumPy pass, treating None as 0"""
+        if not categories:
+            return [0.0] * len(fields)
+        # attrgetter fetches all fields of a category as one tuple in C
+        get_fields = attrgetter(*fields)
+        values = np.fromiter(
+            (value if value is not None else 0.0
+             for category in categories
+             for value in get_fields(category)),
+            dtype=np.float64, count=len(categories) * len(fields)
+        )
+        sums = values.reshape(len(categories), len(fields)).sum(axis=0)
+        return [float(total) for total in sums]
+    
+    def _round_float(self, value: float) -> float:
+        """Round a float total to 2 places with ROUND_HALF_UP, converting to Decimal only here"""
+        # Not math.floor(value * 100 + 0.5) / 100: binary floats round e.g. 1.005 down to 1.0,
+        # while the shortest repr ('1.005') rounds half-up to 1.01 as the Excel figures expect
+        if value.is_integer():
+            return value  # Whole amounts (including zero) are already rounded
+        return float(self._round_decimal(Decimal(repr(value))))
+    
     def _round_decimal(self, value: Decimal) -> Decimal:
         """Round decimal to 2 places"""
-        return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return value.quantize(DECIMAL_CENT, rounding=ROUND_HALF_UP)
     
     def _find_latest_va21_sheet(self) -> Optional[str]:
-        """Find the latest VA21 sheet in the workbook"""
-        try:
-            if not self.workbook:
-                logger.warning("Workbook not loaded when trying to find VA21 sheet")
-                return None
-                
-            va21_sheets = [name for name in self.workbook.sheetnames 
-                           if name.startswith(IdentificationPatterns.VA21_SHEET_PREFIX)]
-            
-            if not va21_sheets:
-                logger.debug("No VA21 sheets found in workbook")
-                return None
-            
-            # Sort sheets to get the latest one
-            va21_sheets.sort(reverse=True)
-            logger.debug(f"Found VA21 sheets: {va21_sheets}, using: {va21_sheets[0]}")
-            return va21_sheets[0]
-            
-        except Exception as e:
-            error_msg = f"Error finding VA21 sheet: {e}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+        """Return the latest VA21 sheet name, resolved once in load_workbook()"""
+        if not self.workbook:
+            logger.warning("Workbook not loaded when trying to find VA21 sheet")
+            return None
+        return self.latest_va21_sheet
     
-    def _convert_wbe_us_to_it(self, wbe_us: str) -> str:
-        """Convert US WBE format to IT format"""
-        try:
-            if not wbe_us:
-                return wbe_us
-                
-            if wbe_us.endswith(IdentificationPatterns.WBE_US_SUFFIX):
-                result = wbe_us.replace(IdentificationPatterns.WBE_US_SUFFIX, 
-                                      IdentificationPatterns.WBE_IT_SUFFIX)
-                logger.debug(f"Converted WBE from {wbe_us} to {result}")
-                return result
-            return wbe_us
-            
-        except Exception as e:
-            error_msg = f"Error converting WBE format from '{wbe_us}': {e}"
-            logger.error(error_msg)
-            raise Exception(error_msg) from e
+    def _resolve_latest_va21_sheet(self) -> Optional[str]:
+        """Find the latest VA21 sheet among the loaded sheet names (single pass, no sort)"""
+        latest_sheet = max(
+            (name for name in self.sheet_names
+             if name.startswith(IdentificationPatterns.VA21_SHEET_PREFIX)),
+            default=None
+        )
+        if latest_sheet is None:
+            logger.debug("No VA21 sheets found in workbook")
+        else:
+            logger.debug(f"Using VA21 sheet: {latest_sheet}")
+        return latest_sheet
 
 # =============================================================================
 # CONVENIENCE FUNCTIONS
@@ -933,43 +1110,87 @@ def parse_analisi_profittabilita_direct(file_path: str, output_path: Optional[st
             except Exception as e:
                 logger.warning(f"Error closing parser: {e}")
 
-def validate_analisi_profittabilita_file(file_path: str) -> Dict[str, Any]:
+def parse_analisi_profittabilita_many(file_paths: List[str], workers: Optional[int] = None) -> List[IndustrialQuotation]:
+    """
+    Parse several Analisi Profittabilita Excel files in parallel worker processes
+    
+    Parsing is CPU-bound and holds the GIL, so files are spread over a process pool.
+    Results are returned in the same order as file_paths; a failure on any file
+    is raised after logging.
+    
+    Example:
+        quotations = parse_analisi_profittabilita_many(["input/ap1.xlsm", "input/ap2.xlsm"], workers=2)
+    
+    Args:
+        file_paths: Paths to the Excel files
+        workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        List[IndustrialQuotation]: One validated quotation per input file
+    """
+    file_paths = [str(file_path) for file_path in file_paths]
+    if not file_paths:
+        return []
+    
+    max_workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    logger.info(f"Parsing {len(file_paths)} files with {max_workers} worker(s)")
+    
+    # A single worker gains nothing from a pool; parse in-process
+    if max_workers == 1:
+        return [parse_analisi_profittabilita_direct(file_path) for file_path in file_paths]
+    
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(parse_analisi_profittabilita_direct, file_paths))
+    except Exception as e:
+        error_msg = f"Unexpected error in parse_analisi_profittabilita_many: {e}"
+        logger.error(error_msg)
+        raise Exception(error_msg) from e
+
+def validate_analisi_profittabilita_file(file_path: Optional[str] = None,
+                                         quotation: Optional[IndustrialQuotation] = None) -> Dict[str, Any]:
     """
     Validate Analisi Profittabilita file and return validation results
     
     Args:
         file_path: Path to the Excel file
+        quotation: Already-parsed quotation to validate instead of parsing file_path again
         
     Returns:
-        Dictionary with validation results
+        Dictionary with validation results and the parsed quotation (None if parsing failed)
     """
     parser = None
     try:
-        logger.info(f"Starting validation process for file: {file_path}")
-        
-        try:
-            parser = DirectAnalisiProfittabilitaParser(file_path)
-        except Exception as e:
-            error_msg = f"Failed to initialize parser for validation of {file_path}: {e}"
-            logger.error(error_msg)
-            return {
-                "is_valid": False,
-                "validation_results": {},
-                "summary_stats": {},
-                "errors": [error_msg]
-            }
-        
-        try:
-            quotation = parser.parse()
-        except Exception as e:
-            error_msg = f"Failed to parse file during validation {file_path}: {e}"
-            logger.error(error_msg)
-            return {
-                "is_valid": False,
-                "validation_results": {},
-                "summary_stats": {},
-                "errors": [error_msg]
-            }
+        if quotation is not None:
+            logger.info("Starting validation process for an already-parsed quotation")
+        else:
+            logger.info(f"Starting validation process for file: {file_path}")
+            
+            try:
+                parser = DirectAnalisiProfittabilitaParser(file_path)
+            except Exception as e:
+                error_msg = f"Failed to initialize parser for validation of {file_path}: {e}"
+                logger.error(error_msg)
+                return {
+                    "is_valid": False,
+                    "validation_results": {},
+                    "summary_stats": {},
+                    "errors": [error_msg],
+                    "quotation": None
+                }
+            
+            try:
+                quotation = parser.parse()
+            except Exception as e:
+                error_msg = f"Failed to parse file during validation {file_path}: {e}"
+                logger.error(error_msg)
+                return {
+                    "is_valid": False,
+                    "validation_results": {},
+                    "summary_stats": {},
+                    "errors": [error_msg],
+                    "quotation": None
+                }
         
         # Run validation checks
         try:
@@ -981,7 +1202,8 @@ def validate_analisi_profittabilita_file(file_path: str) -> Dict[str, Any]:
                 "is_valid": True,
                 "validation_results": validation_results,
                 "summary_stats": summary_stats,
-                "errors": []
+                "errors": [],
+                "quotation": quotation  # Returned so callers need not parse the file again
             }
             
         except Exception as e:
@@ -991,7 +1213,8 @@ def validate_analisi_profittabilita_file(file_path: str) -> Dict[str, Any]:
                 "is_valid": False,
                 "validation_results": {},
                 "summary_stats": {},
-                "errors": [error_msg]
+                "errors": [error_msg],
+                "quotation": quotation
             }
         
     except Exception as e:
@@ -1001,7 +1224,8 @@ def validate_analisi_profittabilita_file(file_path: str) -> Dict[str, Any]:
             "is_valid": False,
             "validation_results": {},
             "summary_stats": {},
-            "errors": [error_msg]
+            "errors": [error_msg],
+            "quotation": None
         }
     finally:
         if parser:
@@ -5,15 +5,30 @@ Converts Excel files with specific format to structured JSON according to schema
 
 import json
 import logging
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 from openpyxl import load_workbook
 
+# Optional fast JSON serializer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import unified models and field mappings
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from models import IndustrialQuotation, FieldMapper, ParserType
+# Make the project root importable once; repeated imports (e.g. in worker processes)
+# must not keep growing sys.path, which every later import miss searches
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
+# The pydantic models are only needed by parse_to_model(); importing them lazily keeps
+# the JSON-only path (parse_pre_to_json) from paying for model class construction
+if TYPE_CHECKING:
+    from models import IndustrialQuotation
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -47,6 +62,9 @@ class ExcelColumns:
     SUB_TOT_COSTO = 21
     TOTALE_COSTO = 22
 
+# Columns that decide whether a data row is a group, category or item
+ROW_KEY_COLUMNS = (ExcelColumns.COD, ExcelColumns.CODICE, ExcelColumns.DENOMINAZIONE, ExcelColumns.QTA)
+
 # Excel Row Constants
 class ExcelRows:
     HEADER_ROW = 17
@@ -70,6 +88,7 @@ class ProjectInfoCells:
     EXCHANGE_RATE = (12, 2)     # Row 12, Column D
     WASTE_DISPOSAL = (13, 2)    # Row 13, Column D
     WARRANTY_PERCENTAGE = (8, 11) # Row 14, Column D
+    MAX_COLUMN = 11               # Widest column read from the header block
 
 # JSON Field Names
 class JsonFields:
@@ -146,10 +165,85 @@ class CalculationConstants:
     DEFAULT_FLOAT = 0.0
     DEFAULT_INT = 0
 
+def _safe_float(value: Any, default: float = CalculationConstants.DEFAULT_FLOAT) -> float:
+    """Safely convert value to float, returning float cells as-is"""
+    if value is None:
+        return default
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+def _safe_str(value: Any) -> str:
+    """Convert a text cell to str, with empty cells as an empty string"""
+    return "" if value is None else str(value)
+
+# Value fields of category and item dicts as (json key, column, converter), in output order;
+# notes and pricelist codes are text, everything else is numeric
+CATEGORY_VALUE_FIELDS = (
+    (JsonFields.SUBTOTAL_LISTINO, ExcelColumns.SUB_TOT_LISTINO, _safe_float),
+    (JsonFields.SUBTOTAL_CODICE, ExcelColumns.SUB_TOT_CODICE, _safe_float),
+    (JsonFields.TOTAL, ExcelColumns.TOTALE, _safe_float),
+    (JsonFields.GROUPS, ExcelColumns.GRUPPI, _safe_float),
+    (JsonFields.TOTAL_OFFER, ExcelColumns.TOTALE_OFFERTA, _safe_float),
+    (JsonFields.TOTAL_OFFER_CURRENCY, ExcelColumns.VALUTA, _safe_float),
+    (JsonFields.TOTAL_CODE_CURRENCY, ExcelColumns.VALUTA, _safe_float),
+    (JsonFields.TOTAL_DISCOUNTED_CURRENCY, ExcelColumns.VALUTA, _safe_float),
+    (JsonFields.NOTES, ExcelColumns.NOTE, _safe_str),
+    (JsonFields.PRICELIST_CODE, ExcelColumns.COD_LISTINO, _safe_str),
+    (JsonFields.TOTAL_DISCOUNTED, ExcelColumns.TOTAL_DISCOUNTED, _safe_float),
+    (JsonFields.UNIT_COST, ExcelColumns.COSTO_UNITARIO, _safe_float),
+    (JsonFields.SUBTOTAL_COST, ExcelColumns.SUB_TOT_COSTO, _safe_float),
+    (JsonFields.TOTAL_COST, ExcelColumns.TOTALE_COSTO, _safe_float),
+)
+
+ITEM_VALUE_FIELDS = (
+    (JsonFields.QUANTITY, ExcelColumns.QTA, _safe_float),
+    (JsonFields.PRICELIST_UNIT_PRICE, ExcelColumns.LIST_UNIT, _safe_float),
+    (JsonFields.PRICELIST_TOTAL_PRICE, ExcelColumns.LISTINO, _safe_float),
+    (JsonFields.NOTES, ExcelColumns.NOTE, _safe_str),
+    (JsonFields.PRICELIST_CODE, ExcelColumns.COD_LISTINO, _safe_str),
+    (JsonFields.UNIT_COST, ExcelColumns.COSTO_UNITARIO, _safe_float),
+    (JsonFields.TOTAL_COST, ExcelColumns.COSTO, _safe_float),
+)
+
+# Widest data row read by extract_product_groups
+DATA_ROW_WIDTH = max(ROW_KEY_COLUMNS + tuple(column for _, column, _ in CATEGORY_VALUE_FIELDS + ITEM_VALUE_FIELDS))
+
+def _compile_row_builder(name: str, leading_keys: tuple, value_fields: tuple):
+    """Generate a straight-line function building a row dict from the fixed column layout.
+    
+    The function takes the row tuple plus one value per leading key; keys and column
+    indices are baked in as literals, so no attribute lookups or loops run per row.
+    """
+    params = ''.join(f', value_{index}' for index in range(len(leading_keys)))
+    entries = [f'{key!r}: value_{index}' for index, key in enumerate(leading_keys)]
+    entries += [f'{key!r}: {converter.__name__}(row_values[{column - 1}])' for key, column, converter in value_fields]
+    source = f"def {name}(row_values{params}):\n    return {{{', '.join(entries)}}}\n"
+    namespace = {converter.__name__: converter for _, _, converter in value_fields}
+    exec(compile(source, f'<{name}>', 'exec'), namespace)
+    return namespace[name]
+
+_build_category = _compile_row_builder(
+    '_build_category',
+    (JsonFields.CATEGORY_ID, JsonFields.CODE, JsonFields.CATEGORY_NAME, JsonFields.ITEMS),
+    CATEGORY_VALUE_FIELDS
+)
+_build_item = _compile_row_builder(
+    '_build_item',
+    (JsonFields.POSITION, JsonFields.CODE, JsonFields.DESCRIPTION),
+    ITEM_VALUE_FIELDS
+)
+
 # Log Messages
 class LogMessages:
     PARSING_START = "Starting to parse {}"
-    WORKBOOK_LOADED = "Loaded workbook with {} rows and {} columns"
+    WORKBOOK_LOADED = "Loaded workbook sheet {}"
     GROUP_FOUND = "Found group: {}"
     CATEGORY_FOUND = "Found category: {}"
     ITEM_FOUND = "Found item: {}"
@@ -174,14 +268,24 @@ class PreFileParser:
         self.file_path = file_path
         self.workbook = None
         self.ws = None
+        # Category offer sums accumulated by extract_product_groups during the row pass
+        self.equipment_total = CalculationConstants.DEFAULT_FLOAT
+        self.installation_total = CalculationConstants.DEFAULT_FLOAT
+        # Parsed result, kept so parse_to_model() after parse() does not read the workbook again
+        self.result: Optional[Dict[str, Any]] = None
         
     def load_workbook(self):
         """Load the Excel workbook"""
         try:
-            self.workbook = load_workbook(self.file_path, data_only=True)
+            # read_only streams the sheet XML instead of building every Cell object;
+            # the sheet is then read with iter_rows() sweeps rather than ws.cell() lookups
+            self.workbook = load_workbook(self.file_path, data_only=True, read_only=True)
             # Use the first worksheet
             self.ws = self.workbook['OFFER1']
-            logger.info(LogMessages.WORKBOOK_LOADED.format(self.ws.max_row, self.ws.max_column))
+            # Read-only sheets trust the stored <dimension>, which some writers leave stale
+            # and would silently cut the sweeps short; recompute the bounds from the rows read
+            self.ws.reset_dimensions()
+            logger.info(LogMessages.WORKBOOK_LOADED.format(self.ws.title))
         except FileNotFoundError:
             raise FileNotFoundError(ErrorMessages.FILE_NOT_FOUND.format(self.file_path))
         except Exception as e:
@@ -189,33 +293,45 @@ class PreFileParser:
     
     def extract_project_info(self) -> Dict[str, Any]:
         """Extract project information from the Excel file"""
+        # Read-only sheets have no cheap random access, so pre-scan the header block once
+        header_rows = list(self.ws.iter_rows(min_row=ExcelRows.PROJECT_INFO_START,
+                                             max_row=ExcelRows.PROJECT_INFO_END,
+                                             max_col=ProjectInfoCells.MAX_COLUMN,
+                                             values_only=True))
+        
+        def header_value(position):
+            row, column = position
+            if row - 1 < len(header_rows):
+                return header_rows[row - 1][column - 1]
+            return None
+        
         # Extract basic project info
-        project_id_cell = self.ws.cell(row=ProjectInfoCells.PROJECT_ID[0], column=ProjectInfoCells.PROJECT_ID[1])
-        customer_cell = self.ws.cell(row=ProjectInfoCells.CUSTOMER[0], column=ProjectInfoCells.CUSTOMER[1])
+        project_id_value = header_value(ProjectInfoCells.PROJECT_ID)
+        customer_value = header_value(ProjectInfoCells.CUSTOMER)
         
-        project_id = self._extract_after_colon(project_id_cell.value) if project_id_cell.value else ""
-        customer = self._extract_after_colon(customer_cell.value) if customer_cell.value else ""
+        project_id = self._extract_after_colon(project_id_value) if project_id_value else ""
+        customer = self._extract_after_colon(customer_value) if customer_value else ""
         
         # Extract parameters
-        doc_cell = self.ws.cell(row=ProjectInfoCells.DOC_PERCENTAGE[0], column=ProjectInfoCells.DOC_PERCENTAGE[1])
-        pm_cell = self.ws.cell(row=ProjectInfoCells.PM_PERCENTAGE[0], column=ProjectInfoCells.PM_PERCENTAGE[1])
-        financial_cell = self.ws.cell(row=ProjectInfoCells.FINANCIAL_COSTS[0], column=ProjectInfoCells.FINANCIAL_COSTS[1])
-        currency_cell = self.ws.cell(row=ProjectInfoCells.CURRENCY[0], column=ProjectInfoCells.CURRENCY[1])
-        exchange_cell = self.ws.cell(row=ProjectInfoCells.EXCHANGE_RATE[0], column=ProjectInfoCells.EXCHANGE_RATE[1])
-        waste_cell = self.ws.cell(row=ProjectInfoCells.WASTE_DISPOSAL[0], column=ProjectInfoCells.WASTE_DISPOSAL[1])
-        warranty_cell = self.ws.cell(row=ProjectInfoCells.WARRANTY_PERCENTAGE[0], column=ProjectInfoCells.WARRANTY_PERCENTAGE[1])
+        doc_value = header_value(ProjectInfoCells.DOC_PERCENTAGE)
+        pm_value = header_value(ProjectInfoCells.PM_PERCENTAGE)
+        financial_value = header_value(ProjectInfoCells.FINANCIAL_COSTS)
+        currency_value = header_value(ProjectInfoCells.CURRENCY)
+        exchange_value = header_value(ProjectInfoCells.EXCHANGE_RATE)
+        waste_value = header_value(ProjectInfoCells.WASTE_DISPOSAL)
+        warranty_value = header_value(ProjectInfoCells.WARRANTY_PERCENTAGE)
         
         return {
             JsonFields.ID: project_id,
             JsonFields.CUSTOMER: customer,
             JsonFields.PARAMETERS: {
-                JsonFields.DOC_PERCENTAGE: self._safe_float(self._extract_after_colon(doc_cell.value)),
-                JsonFields.PM_PERCENTAGE: self._safe_float(self._extract_after_colon(pm_cell.value)),
-                JsonFields.FINANCIAL_COSTS: self._safe_float(self._extract_after_colon(financial_cell.value)),
-                JsonFields.CURRENCY: self._extract_after_colon(currency_cell.value) if currency_cell.value else "",
-                JsonFields.EXCHANGE_RATE: self._safe_float(self._extract_after_colon(exchange_cell.value)),
-                JsonFields.WASTE_DISPOSAL: self._safe_float(self._extract_after_colon(waste_cell.value)),
-                JsonFields.WARRANTY_PERCENTAGE: self._safe_float(self._extract_after_colon(warranty_cell.value)),
+                JsonFields.DOC_PERCENTAGE: self._safe_float(self._extract_after_colon(doc_value)),
+                JsonFields.PM_PERCENTAGE: self._safe_float(self._extract_after_colon(pm_value)),
+                JsonFields.FINANCIAL_COSTS: self._safe_float(self._extract_after_colon(financial_value)),
+                JsonFields.CURRENCY: self._extract_after_colon(currency_value) if currency_value else "",
+                JsonFields.EXCHANGE_RATE: self._safe_float(self._extract_after_colon(exchange_value)),
+                JsonFields.WASTE_DISPOSAL: self._safe_float(self._extract_after_colon(waste_value)),
+                JsonFields.WARRANTY_PERCENTAGE: self._safe_float(self._extract_after_colon(warranty_value)),
                 JsonFields.IS_24H_SERVICE: False  # Default value, could be extracted if present
             },
             JsonFields.SALES_INFO: {
@@ -232,106 +348,103 @@ class PreFileParser:
         current_group = None
         current_category = None
         
-        # Start from data start row
-        for row in range(ExcelRows.DATA_START_ROW, self.ws.max_row + 1):
-            cod_val = self.ws.cell(row=row, column=ExcelColumns.COD).value
-            codice_val = self.ws.cell(row=row, column=ExcelColumns.CODICE).value
-            denominazione_val = self.ws.cell(row=row, column=ExcelColumns.DENOMINAZIONE).value
-            qta_val = self.ws.cell(row=row, column=ExcelColumns.QTA).value
-            listino_val = self.ws.cell(row=row, column=ExcelColumns.LIST_UNIT).value
-            listino_tot_val = self.ws.cell(row=row, column=ExcelColumns.LISTINO).value
-            sub_tot_listino_val = self.ws.cell(row=row, column=ExcelColumns.SUB_TOT_LISTINO).value
-            sub_tot_codice_val = self.ws.cell(row=row, column=ExcelColumns.SUB_TOT_CODICE).value
-            tot_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE).value
-            gruppi_val = self.ws.cell(row=row, column=ExcelColumns.GRUPPI).value
-            tot_offer_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE_OFFERTA).value
-            valuta_val = self.ws.cell(row=row, column=ExcelColumns.VALUTA).value
-            totale_codice_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE_CODICE).value
-            totale_scontato_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE_SCONTATO).value
-            note_val = self.ws.cell(row=row, column=ExcelColumns.NOTE).value
-            cod_listino_val = self.ws.cell(row=row, column=ExcelColumns.COD_LISTINO).value  
-            totale_scontato_val = self.ws.cell(row=row, column=ExcelColumns.TOTAL_DISCOUNTED).value
-            costo_unitario_val = self.ws.cell(row=row, column=ExcelColumns.COSTO_UNITARIO).value
-            costo_val = self.ws.cell(row=row, column=ExcelColumns.COSTO).value
-            sub_tot_costo_val = self.ws.cell(row=row, column=ExcelColumns.SUB_TOT_COSTO).value
-            tot_costo_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE_COSTO).value
+        build_category = _build_category
+        build_item = _build_item
+        # Bound list.append methods for the open group and category; current_group and
+        # current_category guard their use, so they are never called while stale
+        append_group = product_groups.append
+        append_category = None
+        append_item = None
+        group_prefix = IdentificationPatterns.GROUP_PREFIX
+        header_code = IdentificationPatterns.HEADER_CODE
+        category_code_length = IdentificationPatterns.CATEGORY_CODE_LENGTH
+        safe_int = self._safe_int
+        default_quantity = CalculationConstants.DEFAULT_QUANTITY
+        log_info = logger.info
+        log_debug = logger.debug
+        # Checked once: per-item messages are only formatted when debug logging is on
+        log_items = logger.isEnabledFor(logging.DEBUG)
+        total_offer_key = JsonFields.TOTAL_OFFER
+        
+        # Offers are split into equipment and installation ('E' codes) as categories are built,
+        # so parse() does not walk the groups again for the totals
+        equipment_total = CalculationConstants.DEFAULT_FLOAT
+        installation_total = CalculationConstants.DEFAULT_FLOAT
+        
+        # Pull the classification columns out of each row tuple with one C-level itemgetter call;
+        # the generated builders index the numeric columns themselves
+        get_key_values = itemgetter(*[column - 1 for column in ROW_KEY_COLUMNS])
+        
+        # Start from data start row; one streamed sweep bounded to the last data column
+        for row, row_values in enumerate(self.ws.iter_rows(min_row=ExcelRows.DATA_START_ROW,
+                                                           max_col=DATA_ROW_WIDTH,
+                                                           values_only=True),
+                                         start=ExcelRows.DATA_START_ROW):
+            cod_val, codice_val, denominazione_val, qta_val = get_key_values(row_values)
+            # Converted once; empty exactly when the cell is falsy
+            codice_str = str(codice_val) if codice_val else ""
+            cod_str = str(cod_val) if cod_val else ""
             
-
-
             # Check if this is a group header
-            if codice_val and str(codice_val).startswith(IdentificationPatterns.GROUP_PREFIX):
+            if codice_str.startswith(group_prefix):
                 # Save previous group if exists
                 if current_group:
-                    product_groups.append(current_group)
+                    append_group(current_group)
                 
                 # Start new group
+                categories = []
+                append_category = categories.append
                 current_group = {
-                    JsonFields.GROUP_ID: str(codice_val),
+                    JsonFields.GROUP_ID: codice_str,
                     JsonFields.GROUP_NAME: str(denominazione_val) if denominazione_val else "",
-                    JsonFields.QUANTITY: self._safe_int(qta_val, CalculationConstants.DEFAULT_QUANTITY),
-                    JsonFields.CATEGORIES: []
+                    JsonFields.QUANTITY: safe_int(qta_val, default_quantity),
+                    JsonFields.CATEGORIES: categories
                 }
                 current_category = None
-                logger.info(LogMessages.GROUP_FOUND.format(codice_val))
+                log_info(LogMessages.GROUP_FOUND.format(codice_val))
                 
             # Check if this is a category
-            elif cod_val and len(str(cod_val).strip()) == IdentificationPatterns.CATEGORY_CODE_LENGTH and current_group:
-                current_category = {
-                    JsonFields.CATEGORY_ID: str(cod_val),
-                    JsonFields.CODE: str(codice_val),
-                    JsonFields.CATEGORY_NAME: str(denominazione_val) if denominazione_val else "",
-                    JsonFields.ITEMS: [],
-                    JsonFields.SUBTOTAL_LISTINO: self._safe_float(sub_tot_listino_val),
-                    JsonFields.SUBTOTAL_CODICE: self._safe_float(sub_tot_codice_val),
-                    JsonFields.TOTAL: self._safe_float(tot_val),
-                    JsonFields.GROUPS: self._safe_float(gruppi_val),
-                    JsonFields.TOTAL_OFFER: self._safe_float(tot_offer_val),
-                    JsonFields.TOTAL_OFFER_CURRENCY: self._safe_float(valuta_val),
-                    JsonFields.TOTAL_CODE_CURRENCY: self._safe_float(valuta_val),
-                    JsonFields.TOTAL_DISCOUNTED_CURRENCY: self._safe_float(valuta_val),
-                    JsonFields.NOTES: self._safe_float(note_val),
-                    JsonFields.PRICELIST_CODE: self._safe_float(cod_listino_val),
-                    JsonFields.TOTAL_DISCOUNTED: self._safe_float(totale_scontato_val),
-                    JsonFields.UNIT_COST: self._safe_float(costo_unitario_val),
-                    JsonFields.TOTAL_COST: self._safe_float(costo_val),
-                    JsonFields.SUBTOTAL_COST: self._safe_float(sub_tot_costo_val),
-                    JsonFields.TOTAL_COST: self._safe_float(tot_costo_val),
-                    
-                    
-                }
-                current_group[JsonFields.CATEGORIES].append(current_category)
-                logger.info(LogMessages.CATEGORY_FOUND.format(cod_val))
+            elif cod_str and len(cod_str.strip()) == category_code_length and current_group:
+                items = []
+                append_item = items.append
+                current_category = build_category(
+                    row_values,
+                    cod_str,
+                    str(codice_val),
+                    str(denominazione_val) if denominazione_val else "",
+                    items
+                )
+                append_category(current_category)
+                if cod_str[:1] == 'E':
+                    installation_total += current_category[total_offer_key]
+                else:
+                    equipment_total += current_category[total_offer_key]
+                log_info(LogMessages.CATEGORY_FOUND.format(cod_val))
                 
             # Check if this is an item
-            elif codice_val and denominazione_val and current_category \
-                and not str(codice_val).startswith(IdentificationPatterns.GROUP_PREFIX) \
-                and not str(codice_val).startswith(IdentificationPatterns.HEADER_CODE) :
-                item = {
-                    JsonFields.POSITION: str(row),
-                    JsonFields.CODE: str(codice_val),
-                    JsonFields.DESCRIPTION: str(denominazione_val),
-                    JsonFields.QUANTITY: self._safe_float(qta_val),
-                    JsonFields.PRICELIST_UNIT_PRICE: self._safe_float(listino_val),
-                    JsonFields.PRICELIST_TOTAL_PRICE: self._safe_float(listino_tot_val),
-                    JsonFields.NOTES: self._safe_float(note_val),
-                    JsonFields.PRICELIST_CODE: self._safe_float(cod_listino_val),
-                    JsonFields.UNIT_COST: self._safe_float(costo_unitario_val),
-                    JsonFields.TOTAL_COST: self._safe_float(costo_val),
-
-                }
+            # (group-prefixed codes were already taken by the group branch above)
+            elif codice_str and denominazione_val and current_category \
+                and not codice_str.startswith(header_code):
+                item = build_item(row_values, str(row), codice_str, str(denominazione_val))
                 
-                current_category[JsonFields.ITEMS].append(item)
-                logger.debug(LogMessages.ITEM_FOUND.format(codice_val))
+                append_item(item)
+                if log_items:
+                    log_debug(LogMessages.ITEM_FOUND.format(codice_val))
         
         # Add the last group if exists
         if current_group:
             product_groups.append(current_group)
         
-        # Calculate category totals
+        self.equipment_total = equipment_total
+        self.installation_total = installation_total
+        
+        # Calculate category totals; map(itemgetter) sums in C, while NumPy per category
+        # was slower on these short item lists and its pairwise sum changes the last digits
+        get_pricelist_total = itemgetter(JsonFields.PRICELIST_TOTAL_PRICE)
         for group in product_groups:
             for category in group[JsonFields.CATEGORIES]:
                 if not category[JsonFields.SUBTOTAL_LISTINO]:
-                    category[JsonFields.SUBTOTAL_LISTINO] = sum(item[JsonFields.PRICELIST_TOTAL_PRICE] for item in category[JsonFields.ITEMS])
+                    category[JsonFields.SUBTOTAL_LISTINO] = sum(map(get_pricelist_total, category[JsonFields.ITEMS]))
                 if not category[JsonFields.SUBTOTAL_CODICE]:
                     category[JsonFields.SUBTOTAL_CODICE] = category[JsonFields.SUBTOTAL_LISTINO]
                 if not category[JsonFields.TOTAL]:
@@ -344,18 +457,20 @@ class PreFileParser:
         equipment_total = CalculationConstants.DEFAULT_FLOAT
         installation_total = CalculationConstants.DEFAULT_FLOAT
         
-        # Sum up equipment costs from all categories
-        equipment_total = sum(category.get(JsonFields.TOTAL_OFFER, 0) 
-                               for group in product_groups 
-                               for category in group[JsonFields.CATEGORIES]
-                               if not str(category.get(JsonFields.CATEGORY_ID, '')).startswith('E'))
-        
-        # Calculate installation costs
-        installation_total = sum(category.get(JsonFields.TOTAL_OFFER, 0) 
-                               for group in product_groups 
-                               for category in group[JsonFields.CATEGORIES]
-                               if str(category.get(JsonFields.CATEGORY_ID, '')).startswith('E'))
+        # Split category offers into equipment and installation ('E' codes) in a single pass
+        for group in product_groups:
+            for category in group[JsonFields.CATEGORIES]:
+                total_offer = category.get(JsonFields.TOTAL_OFFER, 0)
+                if str(category.get(JsonFields.CATEGORY_ID, ''))[:1] == 'E':
+                    installation_total += total_offer
+                else:
+                    equipment_total += total_offer
         
+        return self._build_totals(equipment_total, installation_total, parameters)
+    
+    def _build_totals(self, equipment_total: float, installation_total: float,
+                      parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate subtotal, fees and grand total from the equipment and installation sums"""
         # Calculate subtotal
         subtotal = equipment_total + installation_total
         
@@ -379,14 +494,23 @@ class PreFileParser:
     
     def parse(self) -> Dict[str, Any]:
         """Main parsing method"""
+        if self.result is not None:
+            return self.result
+        
         logger.info(LogMessages.PARSING_START.format(self.file_path))
         
         self.load_workbook()
         
         # Extract all sections
-        project_info = self.extract_project_info()
-        product_groups = self.extract_product_groups()
-        totals = self.calculate_totals(product_groups, project_info[JsonFields.PARAMETERS])
+        try:
+            project_info = self.extract_project_info()
+            product_groups = self.extract_product_groups()
+        finally:
+            # Read-only workbooks keep the archive open until closed
+            self.workbook.close()
+        # The offer sums were accumulated during extraction; only the fees remain to compute
+        totals = self._build_totals(self.equipment_total, self.installation_total,
+                                    project_info[JsonFields.PARAMETERS])
         
         # Build final structure
         result = {
@@ -396,15 +520,18 @@ class PreFileParser:
         }
         
         logger.info(LogMessages.PARSING_COMPLETED.format(len(product_groups)))
+        self.result = result
         return result
     
-    def parse_to_model(self) -> IndustrialQuotation:
+    def parse_to_model(self) -> 'IndustrialQuotation':
         """
         Parse Excel file directly to IndustrialQuotation model with validation
         
         Returns:
             IndustrialQuotation: Validated quotation model instance
         """
+        from models import IndustrialQuotation, FieldMapper, ParserType
+        
         logger.info(f"Parsing PRE file to IndustrialQuotation model: {self.file_path}")
         
         # Get raw parser data
@@ -425,12 +552,7 @@ class PreFileParser:
     
     def _safe_float(self, value: Any, default: float = CalculationConstants.DEFAULT_FLOAT) -> float:
         """Safely convert value to float"""
-        if value is None:
-            return default
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
+        return _safe_float(value, default)
     
     def _safe_int(self, value: Any, default: int = CalculationConstants.DEFAULT_INT) -> int:
         """Safely convert value to int"""
@@ -446,10 +568,9 @@ class PreFileParser:
         if value is None:
             return ""
         
-        str_value = str(value)
-        if ':' in str_value:
-            return str_value.split(':', 1)[1].strip()
-        return str_value.strip()
+        # partition() finds the first colon in one scan, without building a list
+        head, separator, tail = str(value).partition(':')
+        return (tail if separator else head).strip()
 
 def parse_pre_to_json(file_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -466,13 +587,54 @@ def parse_pre_to_json(file_path: str, output_path: Optional[str] = None) -> Dict
     result = parser.parse()
     
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
         logger.info(LogMessages.JSON_SAVED.format(output_path))
     
     return result
 
-def parse_pre_to_model(file_path: str, output_path: Optional[str] = None) -> IndustrialQuotation:
+def parse_pre_many(file_paths: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Parse several PRE Excel files in parallel worker processes
+    
+    Parsing is CPU-bound and holds the GIL, so files are spread over a process pool.
+    Results are returned in the same order as file_paths; a failure on any file
+    is raised after logging.
+    
+    Example:
+        results = parse_pre_many(["input/pre1.xlsx", "input/pre2.xlsx"], workers=2)
+    
+    Args:
+        file_paths: Paths to the Excel files
+        workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        List of parsed data dictionaries, in the order of file_paths
+    """
+    file_paths = [str(file_path) for file_path in file_paths]
+    if not file_paths:
+        return []
+    
+    max_workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    logger.info(f"Parsing {len(file_paths)} files with {max_workers} worker(s)")
+    
+    # A single worker gains nothing from a pool; parse in-process
+    if max_workers == 1:
+        return [parse_pre_to_json(file_path) for file_path in file_paths]
+    
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(parse_pre_to_json, file_paths))
+    except Exception as e:
+        error_msg = f"Unexpected error in parse_pre_many: {e}"
+        logger.error(error_msg)
+        raise Exception(error_msg) from e
+
+def parse_pre_to_model(file_path: str, output_path: Optional[str] = None) -> 'IndustrialQuotation':
     """
     Main function to parse Excel file to IndustrialQuotation model with validation
     
@@ -491,6 +653,21 @@ def parse_pre_to_model(file_path: str, output_path: Optional[str] = None) -> Ind
     
     return quotation
 
+def parse_pre_to_json_and_model(file_path: str) -> Tuple[Dict[str, Any], 'IndustrialQuotation']:
+    """
+    Parse an Excel file once into both the raw dictionary and the IndustrialQuotation model
+    
+    Args:
+        file_path: Path to the Excel file
+        
+    Returns:
+        Tuple of the parsed data dictionary and the validated quotation model
+    """
+    parser = PreFileParser(file_path)
+    result = parser.parse()
+    quotation = parser.parse_to_model()  # Reuses the cached parse result
+    return result, quotation
+
 
 if __name__ == "__main__":
     # Example usage
@@ -6,6 +6,8 @@ Converts Excel files with PRE format directly to IndustrialQuotation objects
 
 import logging
 import decimal
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Optional, Any, Dict
 from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
@@ -14,7 +16,10 @@ from openpyxl import load_workbook
 # Import unified models
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# Add the project root for the models package, unless it is already on the path
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.append(_project_root)
 from models.quotation_models import (
     IndustrialQuotation, ProjectInfo, ProjectParameters, SalesInfo,
     ProductGroup, QuotationCategory, QuotationItem, QuotationTotals,
@@ -53,6 +58,60 @@ class ExcelColumns:
     SUB_TOT_COSTO = 21
     TOTALE_COSTO = 22
 
+# OFFER1 columns unpacked for each data row, in extract_product_groups' order
+DATA_ROW_COLUMNS = (
+    ExcelColumns.COD, ExcelColumns.CODICE, ExcelColumns.DENOMINAZIONE, ExcelColumns.QTA,
+    ExcelColumns.LIST_UNIT, ExcelColumns.LISTINO, ExcelColumns.SUB_TOT_LISTINO,
+    ExcelColumns.SUB_TOT_CODICE, ExcelColumns.TOTALE, ExcelColumns.GRUPPI,
+    ExcelColumns.TOTALE_OFFERTA, ExcelColumns.NOTE, ExcelColumns.COD_LISTINO,
+    ExcelColumns.COSTO_UNITARIO, ExcelColumns.COSTO, ExcelColumns.SUB_TOT_COSTO,
+    ExcelColumns.TOTALE_COSTO,
+)
+
+# Shared Decimal constants (Decimals are immutable, so one instance can be reused)
+DECIMAL_ZERO = Decimal("0.0")
+DECIMAL_HUNDRED = Decimal("100")
+
+# Cell values treated as empty by _safe_decimal
+NULL_NUMERIC_STRINGS = frozenset(['n/a', 'na', 'null', 'none', '-', ''])
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    """Convert a non-empty cell value to Decimal, or None if it holds no number.
+    
+    Cached because the same zeros, quantities and prices recur throughout a sheet;
+    typed so that True, 1 and 1.0 keep separate entries.
+    """
+    # openpyxl hands numeric cells over as int/float; those need no string cleaning
+    value_type = type(value)
+    if value_type is int:
+        return Decimal(value)
+    if value_type is float:
+        return Decimal(repr(value))
+    
+    try:
+        # Convert to string and clean up
+        str_value = str(value).strip()
+        
+        # Handle empty strings and common non-numeric values
+        if str_value.lower() in NULL_NUMERIC_STRINGS:
+            return None
+            
+        # Remove currency symbols and common formatting
+        # (chained replace() measured faster than str.translate on these short strings)
+        str_value = str_value.replace('€', '').replace('$', '').replace(',', '').strip()
+        
+        # Handle percentage notation
+        if str_value.endswith('%'):
+            str_value = str_value[:-1]
+            return Decimal(str_value) / DECIMAL_HUNDRED
+        
+        return Decimal(str_value)
+        
+    except (ValueError, TypeError, decimal.InvalidOperation) as e:
+        logger.debug(f"Could not convert '{value}' to Decimal: {e}")
+        return None
+
 # Excel Row Constants
 class ExcelRows:
     HEADER_ROW = 17
@@ -69,6 +128,8 @@ class ProjectInfoCells:
     EXCHANGE_RATE = (12, 2)     # Row 12, Column B
     WASTE_DISPOSAL = (13, 2)    # Row 13, Column B
     WARRANTY_PERCENTAGE = (8, 11) # Row 8, Column K
+    MAX_ROW = 13                  # Header block read in one sweep: rows 1-13,
+    MAX_COLUMN = 11               # columns A-K
 
 # Identification Patterns
 class IdentificationPatterns:
@@ -115,9 +176,11 @@ class DirectPreFileParser:
     def load_workbook(self) -> None:
         """Load the Excel workbook"""
         try:
-            self.workbook = load_workbook(str(self.file_path), data_only=True)
-            self.ws = self.workbook['OFFER1']
-            logger.info(f"Loaded workbook with {self.ws.max_row} rows and {self.ws.max_column} columns")
+            # read_only streams sheet XML instead of materializing every cell and style;
+            # sheets are then consumed with iter_rows() sweeps, never ws.cell() lookups
+            self.workbook = load_workbook(str(self.file_path), data_only=True, read_only=True, keep_links=False)
+            self.ws = self._get_sheet('OFFER1')
+            logger.info(f"Loaded workbook sheet {self.ws.title}")
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {self.file_path}")
         except Exception as e:
@@ -125,31 +188,36 @@ class DirectPreFileParser:
     
     def extract_project_info(self) -> ProjectInfo:
         """Extract project information and create ProjectInfo object"""
-        # Extract basic project info
-        project_id_cell = self.ws.cell(row=ProjectInfoCells.PROJECT_ID[0], column=ProjectInfoCells.PROJECT_ID[1])
-        customer_cell = self.ws.cell(row=ProjectInfoCells.CUSTOMER[0], column=ProjectInfoCells.CUSTOMER[1])
+        # Random cell access is slow on read-only sheets; read the header block once
+        header_rows = list(self.ws.iter_rows(min_row=1, max_row=ProjectInfoCells.MAX_ROW,
+                                             max_col=ProjectInfoCells.MAX_COLUMN, values_only=True))
+        
+        def cell_value(position):
+            row, column = position
+            return header_rows[row - 1][column - 1] if row <= len(header_rows) else None
         
-        project_id = self._extract_after_colon(project_id_cell.value, "")
-        customer = self._extract_after_colon(customer_cell.value, "")
+        # Extract basic project info
+        project_id = self._extract_after_colon(cell_value(ProjectInfoCells.PROJECT_ID), "")
+        customer = self._extract_after_colon(cell_value(ProjectInfoCells.CUSTOMER), "")
         
         # Extract parameters
-        doc_cell = self.ws.cell(row=ProjectInfoCells.DOC_PERCENTAGE[0], column=ProjectInfoCells.DOC_PERCENTAGE[1])
-        pm_cell = self.ws.cell(row=ProjectInfoCells.PM_PERCENTAGE[0], column=ProjectInfoCells.PM_PERCENTAGE[1])
-        financial_cell = self.ws.cell(row=ProjectInfoCells.FINANCIAL_COSTS[0], column=ProjectInfoCells.FINANCIAL_COSTS[1])
-        currency_cell = self.ws.cell(row=ProjectInfoCells.CURRENCY[0], column=ProjectInfoCells.CURRENCY[1])
-        exchange_cell = self.ws.cell(row=ProjectInfoCells.EXCHANGE_RATE[0], column=ProjectInfoCells.EXCHANGE_RATE[1])
-        waste_cell = self.ws.cell(row=ProjectInfoCells.WASTE_DISPOSAL[0], column=ProjectInfoCells.WASTE_DISPOSAL[1])
-        warranty_cell = self.ws.cell(row=ProjectInfoCells.WARRANTY_PERCENTAGE[0], column=ProjectInfoCells.WARRANTY_PERCENTAGE[1])
+        doc_value = cell_value(ProjectInfoCells.DOC_PERCENTAGE)
+        pm_value = cell_value(ProjectInfoCells.PM_PERCENTAGE)
+        financial_value = cell_value(ProjectInfoCells.FINANCIAL_COSTS)
+        currency_value = cell_value(ProjectInfoCells.CURRENCY)
+        exchange_value = cell_value(ProjectInfoCells.EXCHANGE_RATE)
+        waste_value = cell_value(ProjectInfoCells.WASTE_DISPOSAL)
+        warranty_value = cell_value(ProjectInfoCells.WARRANTY_PERCENTAGE)
         
         # Create parameters object
         parameters = ProjectParameters(
-            doc_percentage=self._safe_decimal(self._extract_after_colon(doc_cell.value)),
-            pm_percentage=self._safe_decimal(self._extract_after_colon(pm_cell.value)),
-            financial_costs=self._safe_decimal(self._extract_after_colon(financial_cell.value)),
-            currency=self._extract_after_colon(currency_cell.value, "EUR"),
-            exchange_rate=self._safe_decimal(self._extract_after_colon(exchange_cell.value), Decimal("1.0")),
-            waste_disposal=self._safe_decimal(self._extract_after_colon(waste_cell.value)),
-            warranty_percentage=self._safe_decimal(self._extract_after_colon(warranty_cell.value)),
+            doc_percentage=self._safe_decimal(self._extract_after_colon(doc_value)),
+            pm_percentage=self._safe_decimal(self._extract_after_colon(pm_value)),
+            financial_costs=self._safe_decimal(self._extract_after_colon(financial_value)),
+            currency=self._extract_after_colon(currency_value, "EUR"),
+            exchange_rate=self._safe_decimal(self._extract_after_colon(exchange_value), Decimal("1.0")),
+            waste_disposal=self._safe_decimal(self._extract_after_colon(waste_value)),
+            warranty_percentage=self._safe_decimal(self._extract_after_colon(warranty_value)),
             is_24h_service=False  # Default value, could be extracted if present
         )
         
@@ -177,98 +245,89 @@ class DirectPreFileParser:
         # Extract MDC data
         self.mdc_data = self.extract_mdc_offer_data()
         
-        # Start from data start row
-        for row in range(ExcelRows.DATA_START_ROW, self.ws.max_row + 1):
+        # One itemgetter call per row replaces a subscript and attribute lookup per column
+        get_cell_values = itemgetter(*[column - 1 for column in DATA_ROW_COLUMNS])
+        
+        # Loop-invariant lookups bound once as locals
+        safe_decimal = self._safe_decimal
+        safe_int = self._safe_int
+        mdc_data = self.mdc_data
+        append_group = product_groups.append
+        group_prefix = IdentificationPatterns.GROUP_PREFIX
+        header_code = IdentificationPatterns.HEADER_CODE
+        category_code_length = IdentificationPatterns.CATEGORY_CODE_LENGTH
+        
+        # Start from data start row; one streamed sweep, padded out to the last column used
+        for row, row_values in enumerate(self.ws.iter_rows(min_row=ExcelRows.DATA_START_ROW,
+                                                           max_col=max(DATA_ROW_COLUMNS),
+                                                           values_only=True),
+                                         start=ExcelRows.DATA_START_ROW):
             # Get cell values
-            cod_val = self.ws.cell(row=row, column=ExcelColumns.COD).value
-            codice_val = self.ws.cell(row=row, column=ExcelColumns.CODICE).value
-            denominazione_val = self.ws.cell(row=row, column=ExcelColumns.DENOMINAZIONE).value
-            qta_val = self.ws.cell(row=row, column=ExcelColumns.QTA).value
-            listino_val = self.ws.cell(row=row, column=ExcelColumns.LIST_UNIT).value
-            listino_tot_val = self.ws.cell(row=row, column=ExcelColumns.LISTINO).value
-            sub_tot_listino_val = self.ws.cell(row=row, column=ExcelColumns.SUB_TOT_LISTINO).value
-            sub_tot_codice_val = self.ws.cell(row=row, column=ExcelColumns.SUB_TOT_CODICE).value
-            tot_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE).value
-            gruppi_val = self.ws.cell(row=row, column=ExcelColumns.GRUPPI).value
-            tot_offer_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE_OFFERTA).value
-            note_val = self.ws.cell(row=row, column=ExcelColumns.NOTE).value
-            cod_listino_val = self.ws.cell(row=row, column=ExcelColumns.COD_LISTINO).value
-            costo_unitario_val = self.ws.cell(row=row, column=ExcelColumns.COSTO_UNITARIO).value
-            costo_val = self.ws.cell(row=row, column=ExcelColumns.COSTO).value
-            sub_tot_costo_val = self.ws.cell(row=row, column=ExcelColumns.SUB_TOT_COSTO).value
-            tot_costo_val = self.ws.cell(row=row, column=ExcelColumns.TOTALE_COSTO).value
+            (cod_val, codice_val, denominazione_val, qta_val, listino_val, listino_tot_val,
+             sub_tot_listino_val, sub_tot_codice_val, tot_val, gruppi_val, tot_offer_val, note_val,
+             cod_listino_val, costo_unitario_val, costo_val, sub_tot_costo_val,
+             tot_costo_val) = get_cell_values(row_values)
+            codice_str = str(codice_val) if codice_val else ""
             
             # Check if this is a group header
-            if codice_val and str(codice_val).startswith(IdentificationPatterns.GROUP_PREFIX):
+            if codice_str.startswith(group_prefix):
                 # Save previous group if exists
                 if current_group:
-                    product_groups.append(current_group)
+                    append_group(current_group)
                 
                 # Start new group
                 current_group = ProductGroup(
-                    group_id=str(codice_val),
+                    group_id=codice_str,
                     group_name=str(denominazione_val) if denominazione_val else "",
-                    quantity=self._safe_int(qta_val, 1),
+                    quantity=safe_int(qta_val, 1),
                     categories=[]
                 )
                 current_category = None
                 logger.info(f"Found group: {codice_val}")
                 
             # Check if this is a category
-            elif cod_val and len(str(cod_val).strip()) == IdentificationPatterns.CATEGORY_CODE_LENGTH and current_group:
-                category_type = self._determine_category_type(str(cod_val))
+            elif cod_val and len(str(cod_val).strip()) == category_code_length and current_group:
+                cod_str = str(cod_val)
+                category_type = self._determine_category_type(cod_str)
+                
+                # The MDC row for this category, looked up once for all three MDC-derived fields
+                mdc_entry = mdc_data.get(cod_str + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {})
+                sale_eur = mdc_entry.get(MDCColumns.SALE_EUR)
+                margin_eur = mdc_entry.get(MDCColumns.MARGIN_EUR)
+                margin_percentage = mdc_entry.get(MDCColumns.MARGIN_PERCENTAGE)
                 
                 current_category = QuotationCategory(
-                    category_id=str(cod_val),
+                    category_id=cod_str,
                     category_name=str(denominazione_val) if denominazione_val else "",
                     wbe=codice_val,
                     items=[],
-                    pricelist_subtotal=float(self._safe_decimal(sub_tot_listino_val)),
-                    cost_subtotal=float(self._safe_decimal(sub_tot_costo_val)),
-                    total_cost=float(self._safe_decimal(tot_costo_val)),
-                    groups_count=float(self._safe_decimal(gruppi_val)),
+                    pricelist_subtotal=float(safe_decimal(sub_tot_listino_val)),
+                    cost_subtotal=float(safe_decimal(sub_tot_costo_val)),
+                    total_cost=float(safe_decimal(tot_costo_val)),
+                    groups_count=float(safe_decimal(gruppi_val)),
                     notes=str(note_val) if note_val else "",
                     #offer_price=float(self._safe_decimal(tot_offer_val)) if tot_offer_val else None,
-                    offer_price = (
-                        float(self._safe_decimal(
-                            self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.SALE_EUR)
-                        ))
-                        if self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.SALE_EUR) is not None
-                        else None
-                    ),
-                    margin_amount = (
-                        float(self._safe_decimal(
-                            self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.MARGIN_EUR)
-                        ))
-                        if self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.MARGIN_EUR) is not None
-                        else None
-                    ),
-                    margin_percentage = (
-                        float(self._safe_decimal(
-                            self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.MARGIN_PERCENTAGE)
-                        ))
-                        if self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.MARGIN_PERCENTAGE) is not None
-                        else None
-                    )
+                    offer_price=float(safe_decimal(sale_eur)) if sale_eur is not None else None,
+                    margin_amount=float(safe_decimal(margin_eur)) if margin_eur is not None else None,
+                    margin_percentage=float(safe_decimal(margin_percentage)) if margin_percentage is not None else None
                 )
                 current_group.categories.append(current_category)
                 logger.info(f"Found category: {cod_val}")
-                logger.info(f"   MDC data: {self.mdc_data.get(str(cod_val) + '_' + str(current_group.group_name) + '_' + str(tot_offer_val), {}).get(MDCColumns.SALE_EUR)}")
+                logger.info(f"   MDC data: {sale_eur}")
                 
-            # Check if this is an item
-            elif (codice_val and denominazione_val and current_category 
-                  and not str(codice_val).startswith(IdentificationPatterns.GROUP_PREFIX) 
-                  and not str(codice_val).startswith(IdentificationPatterns.HEADER_CODE)):
+            # Check if this is an item (group-prefixed codes were taken by the group branch)
+            elif (codice_str and denominazione_val and current_category
+                  and not codice_str.startswith(header_code)):
                 
                 item = QuotationItem(
                     position=str(row),
-                    code=str(codice_val),
+                    code=codice_str,
                     description=str(denominazione_val),
-                    quantity=float(self._safe_decimal(qta_val)),
-                    pricelist_unit_price=float(self._safe_decimal(listino_val)),
-                    pricelist_total_price=float(self._safe_decimal(listino_tot_val)),
-                    unit_cost=float(self._safe_decimal(costo_unitario_val)),
-                    total_cost=float(self._safe_decimal(costo_val))
+                    quantity=float(safe_decimal(qta_val)),
+                    pricelist_unit_price=float(safe_decimal(listino_val)),
+                    pricelist_total_price=float(safe_decimal(listino_tot_val)),
+                    unit_cost=float(safe_decimal(costo_unitario_val)),
+                    total_cost=float(safe_decimal(costo_val))
                 )
                 
                 current_category.items.append(item)
@@ -348,16 +407,18 @@ class DirectPreFileParser:
             return {}
         
         try:
-            mdc_ws = self.workbook[mdc_sheet_name]
+            mdc_ws = self._get_sheet(mdc_sheet_name)
             logger.info(f"Processing MDC sheet: {mdc_sheet_name}")
             
             group = ''
             mdc_data = {}
-            for row in range(MDCRows.DATA_START_ROW, mdc_ws.max_row + 1):
+            for row_values in mdc_ws.iter_rows(min_row=MDCRows.DATA_START_ROW,
+                                               max_col=MDCColumns.MARGIN_PERCENTAGE,
+                                               values_only=True):
                 
-                cod = mdc_ws.cell(row=row, column=MDCColumns.COD).value
-                description = mdc_ws.cell(row=row, column=MDCColumns.DESCRIPTION).value
-                amt = mdc_ws.cell(row=row, column=MDCColumns.OFFER_EUR).value
+                cod = row_values[MDCColumns.COD - 1]
+                description = row_values[MDCColumns.DESCRIPTION - 1]
+                amt = row_values[MDCColumns.OFFER_EUR - 1]
 
                 if description:
                    
@@ -370,20 +431,20 @@ class DirectPreFileParser:
                     mdc_data[key] = {
                         MDCColumns.COD: cod,
                         MDCColumns.DESCRIPTION: description,
-                        MDCColumns.COD_NUMBER: mdc_ws.cell(row=row, column=MDCColumns.COD_NUMBER).value,
-                        MDCColumns.DIRECT_COST_EUR: mdc_ws.cell(row=row, column=MDCColumns.DIRECT_COST_EUR).value,
-                        MDCColumns.PRICELIST_EUR: mdc_ws.cell(row=row, column=MDCColumns.PRICELIST_EUR).value,
-                        MDCColumns.OFFER_EUR: mdc_ws.cell(row=row, column=MDCColumns.OFFER_EUR).value,
-                        MDCColumns.SALE_EUR: mdc_ws.cell(row=row, column=MDCColumns.SALE_EUR).value,
-                        MDCColumns.COMMISSION_COST_EUR: mdc_ws.cell(row=row, column=MDCColumns.COMMISSION_COST_EUR).value,
-                        MDCColumns.FINANCIAL_FEE_EUR: mdc_ws.cell(row=row, column=MDCColumns.FINANCIAL_FEE_EUR).value,
-                        MDCColumns.PROJECT_MANAGEMENT_COST_EUR: mdc_ws.cell(row=row, column=MDCColumns.PROJECT_MANAGEMENT_COST_EUR).value,
-                        MDCColumns.WARRANTY_FEE_EUR: mdc_ws.cell(row=row, column=MDCColumns.WARRANTY_FEE_EUR).value,
-                        MDCColumns.H24_FIRST_YEAR_COST_EUR: mdc_ws.cell(row=row, column=MDCColumns.H24_FIRST_YEAR_COST_EUR).value,
-                        MDCColumns.WASTE_DISPOSAL_COST_EUR: mdc_ws.cell(row=row, column=MDCColumns.WASTE_DISPOSAL_COST_EUR).value,
-                        MDCColumns.DOCUMENTATION_COST_EUR: mdc_ws.cell(row=row, column=MDCColumns.DOCUMENTATION_COST_EUR).value,
-                        MDCColumns.MARGIN_EUR: mdc_ws.cell(row=row, column=MDCColumns.MARGIN_EUR).value,
-                        MDCColumns.MARGIN_PERCENTAGE: mdc_ws.cell(row=row, column=MDCColumns.MARGIN_PERCENTAGE).value
+                        MDCColumns.COD_NUMBER: row_values[MDCColumns.COD_NUMBER - 1],
+                        MDCColumns.DIRECT_COST_EUR: row_values[MDCColumns.DIRECT_COST_EUR - 1],
+                        MDCColumns.PRICELIST_EUR: row_values[MDCColumns.PRICELIST_EUR - 1],
+                        MDCColumns.OFFER_EUR: row_values[MDCColumns.OFFER_EUR - 1],
+                        MDCColumns.SALE_EUR: row_values[MDCColumns.SALE_EUR - 1],
+                        MDCColumns.COMMISSION_COST_EUR: row_values[MDCColumns.COMMISSION_COST_EUR - 1],
+                        MDCColumns.FINANCIAL_FEE_EUR: row_values[MDCColumns.FINANCIAL_FEE_EUR - 1],
+                        MDCColumns.PROJECT_MANAGEMENT_COST_EUR: row_values[MDCColumns.PROJECT_MANAGEMENT_COST_EUR - 1],
+                        MDCColumns.WARRANTY_FEE_EUR: row_values[MDCColumns.WARRANTY_FEE_EUR - 1],
+                        MDCColumns.H24_FIRST_YEAR_COST_EUR: row_values[MDCColumns.H24_FIRST_YEAR_COST_EUR - 1],
+                        MDCColumns.WASTE_DISPOSAL_COST_EUR: row_values[MDCColumns.WASTE_DISPOSAL_COST_EUR - 1],
+                        MDCColumns.DOCUMENTATION_COST_EUR: row_values[MDCColumns.DOCUMENTATION_COST_EUR - 1],
+                        MDCColumns.MARGIN_EUR: row_values[MDCColumns.MARGIN_EUR - 1],
+                        MDCColumns.MARGIN_PERCENTAGE: row_values[MDCColumns.MARGIN_PERCENTAGE - 1]
                     }
                     
                     #logger.debug(f"MDC offer: {description} = €{mdc_data[key][MDCColumns.OFFER_EUR]:,.2f}")
@@ -397,13 +458,12 @@ class DirectPreFileParser:
     
     def calculate_totals(self, product_groups: List[ProductGroup], parameters: ProjectParameters) -> QuotationTotals:
         """Calculate total costs and fees"""
-        total_pricelist = Decimal("0.0")
-        total_cost = Decimal("0.0")
-        total_offer = Decimal("0.0")
-        offer_margin = Decimal("0.0")
-        offer_margin_percentage = Decimal("0.0")
+        total_pricelist = 0.0
+        total_cost = 0.0
+        total_offer = 0.0
+        offer_margin = 0.0
         
-        # Sum up costs from all categories
+        # Sum up costs from all categories; the category fields are already floats
         for group in product_groups:
             for category in group.categories:
                 
@@ -414,18 +474,12 @@ class DirectPreFileParser:
                 #logger.info(f"   Margin amount: {category.margin_amount}")
                 #logger.info(f"   Margin percentage: {category.margin_percentage}")
                 
-                # Use offer_price if available, otherwise pricelist_subtotal
-                category_pricelist  = Decimal(str(category.pricelist_subtotal)) if category.pricelist_subtotal is not None else Decimal("0.0")
-                category_groups_count = Decimal(str(category.groups_count)) if category.groups_count is not None else Decimal("0.0")
-                category_cost = Decimal(str(category.total_cost)) if category.total_cost is not None else Decimal("0.0")
-                category_offer = Decimal(str(category.offer_price)) if category.offer_price is not None else Decimal("0.0")
-                category_margin_amount = Decimal(str(category.margin_amount)) if category.margin_amount is not None else Decimal("0.0")
-
-                total_pricelist += category_pricelist * category_groups_count
-                total_cost += category_cost
-                total_offer += category_offer
-                offer_margin += category_margin_amount
-                offer_margin_percentage = offer_margin / total_offer * 100
+                total_pricelist += (category.pricelist_subtotal or 0.0) * (category.groups_count or 0.0)
+                total_cost += category.total_cost or 0.0
+                total_offer += category.offer_price or 0.0
+                offer_margin += category.margin_amount or 0.0
+        
+        offer_margin_percentage = offer_margin / total_offer * 100 if total_offer else 0.0
                 
         logger.info(f"Total pricelist: {total_pricelist}")
         logger.info(f"Total cost: {total_cost}")
@@ -434,11 +488,11 @@ class DirectPreFileParser:
         logger.info(f"Offer margin percentage: {offer_margin_percentage}")
                 
         return QuotationTotals(
-            total_pricelist=float(self._round_decimal(total_pricelist)),
-            total_cost=float(self._round_decimal(total_cost)),
-            total_offer=float(self._round_decimal(total_offer)),
-            offer_margin=float(self._round_decimal(offer_margin)),
-            offer_margin_percentage=float(self._round_decimal(offer_margin_percentage))
+            total_pricelist=self._round_float(total_pricelist),
+            total_cost=self._round_float(total_cost),
+            total_offer=self._round_float(total_offer),
+            offer_margin=self._round_float(offer_margin),
+            offer_margin_percentage=self._round_float(offer_margin_percentage)
         )
     
     def close(self):
@@ -484,36 +538,32 @@ class DirectPreFileParser:
         except Exception:
             return default
         
+    def _get_sheet(self, sheet_name: str) -> Any:
+        """Return the read-only worksheet sheet_name with its bounds recomputed from the data"""
+        ws = self.workbook[sheet_name]
+        # Read-only sheets otherwise stop at the stored <dimension>, which some writers leave stale
+        ws.reset_dimensions()
+        return ws
+    
     def _safe_decimal(self, value: Any, default: Decimal = None) -> Decimal:
         """Safely convert value to Decimal"""
         if value is None or value == "":
-            return default if default is not None else Decimal("0.0")
+            return default if default is not None else DECIMAL_ZERO
         
-        try:
-            # Convert to string and clean up
-            str_value = str(value).strip()
-            
-            # Handle empty strings after stripping
-            if not str_value:
-                return default if default is not None else Decimal("0.0")
-            
-            # Handle common non-numeric values
-            if str_value.lower() in ['n/a', 'na', 'null', 'none', '-', '']:
-                return default if default is not None else Decimal("0.0")
-                
-            # Remove currency symbols and common formatting
-            str_value = str_value.replace('€', '').replace('$', '').replace(',', '').strip()
-            
-            # Handle percentage notation
-            if str_value.endswith('%'):
-                str_value = str_value[:-1]
-                return Decimal(str_value) / Decimal("100")
-            
-            return Decimal(str_value)
-            
-        except (ValueError, TypeError, decimal.InvalidOperation) as e:
-            logger.debug(f"Could not convert '{value}' to Decimal: {e}")
-            return default if default is not None else Decimal("0.0")
+        if value == 0:
+            # 0.0 and -0.0 (likewise Decimal zeros) compare and hash equal and would share a
+            # cache entry, so the sign would depend on which came first; zeros skip the cache
+            result = _to_decimal.__wrapped__(value)
+        else:
+            try:
+                result = _to_decimal(value)
+            except TypeError:
+                # Unhashable value, convert it without the cache
+                result = _to_decimal.__wrapped__(value)
+        
+        if result is None:
+            return default if default is not None else DECIMAL_ZERO
+        return result
     
     def _safe_int(self, value: Any, default: int = 0) -> int:
         """Safely convert value to int"""
@@ -528,6 +578,10 @@ class DirectPreFileParser:
         """Round decimal to 2 places"""
         return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
     
+    def _round_float(self, value: float) -> float:
+        """Round float to 2 places, half up on its shortest decimal repr"""
+        return float(self._round_decimal(Decimal(repr(value))))
+    
     def _extract_after_colon(self, value: Any, default: str = "") -> str:
         """Extract text after colon, or return the value as string"""
         if value is None:
@@ -0,0 +1,227 @@
+"""
+Test script for the direct Analisi Profittabilita parser backends
+Checks the openpyxl read-only path and that python-calamine produces the same quotation
+"""
+
+import sys
+import os
+import re
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+import parsers.analisi_profittabilita_parser_direct as direct_parser
+from parsers.analisi_profittabilita_parser_direct import (
+    DirectAnalisiProfittabilitaParser, ExcelColumns, ExcelRows, VA21Columns, VA21Rows
+)
+
+
+def create_sample_workbook(path: str) -> None:
+    """Write a small AP workbook mixing text codes, numeric codes, integral and fractional floats"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "NEW_OFFER1"
+    ws.cell(1, 1, "PRJ-AP-001")
+    ws.cell(2, 1, 2024)  # Numeric listino, read as text
+    ws.cell(3, ExcelColumns.DENOMINAZIONE, "DENOMINAZIONE")
+
+    row = 4
+    for group_idx in range(2):
+        ws.cell(row, ExcelColumns.PRIORITY, 1)
+        ws.cell(row, ExcelColumns.CODICE, f"TXT-G{group_idx}")
+        ws.cell(row, ExcelColumns.DENOMINAZIONE, f"Group {group_idx}")
+        ws.cell(row, ExcelColumns.QTA, 2)
+        row += 1
+
+        for cat_idx in range(2):
+            ws.cell(row, ExcelColumns.COD, f"A{group_idx}{cat_idx}Z")
+            ws.cell(row, ExcelColumns.PRIORITY, 2)
+            ws.cell(row, ExcelColumns.WBE, f"CC{group_idx}{cat_idx}-A-PC0{cat_idx}-IT")
+            ws.cell(row, ExcelColumns.CODICE, f"CAT{cat_idx}")
+            ws.cell(row, ExcelColumns.DENOMINAZIONE, f"Category {group_idx}-{cat_idx}")
+            ws.cell(row, ExcelColumns.SUB_TOT_LISTINO, 1500.0)
+            ws.cell(row, ExcelColumns.SUBTOT_COSTO, 1000.25)
+            ws.cell(row, ExcelColumns.COSTO_TOTALE, 1000)
+            row += 1
+
+            for item_idx in range(4):
+                ws.cell(row, ExcelColumns.PRIORITY, 3)
+                ws.cell(row, ExcelColumns.PRIORITY_ORDER, item_idx + 0.5)
+                ws.cell(row, ExcelColumns.POSITION, 10 * (item_idx + 1))
+                ws.cell(row, ExcelColumns.CODICE, 12345 + item_idx if item_idx % 2 else f"ITM{item_idx}")
+                ws.cell(row, ExcelColumns.COD_LISTINO, 7 if item_idx == 1 else None)
+                ws.cell(row, ExcelColumns.DENOMINAZIONE, f"Item {group_idx}-{cat_idx}-{item_idx}")
+                ws.cell(row, ExcelColumns.QTA, 2)
+                ws.cell(row, ExcelColumns.LIST_UNIT, 100.0)
+                ws.cell(row, ExcelColumns.LISTINO_TOTALE, 200.0 if item_idx else None)
+                ws.cell(row, ExcelColumns.COSTO_UNITARIO, 75.5)
+                ws.cell(row, ExcelColumns.COSTO_TOTALE, 151)
+                ws.cell(row, ExcelColumns.COD_2, "INT" if item_idx == 2 else 4)
+                ws.cell(row, ExcelColumns.UTM_ROBOT, 12.75)
+                ws.cell(row, ExcelColumns.PM_H, "8")
+                ws.cell(row, ExcelColumns.AFTER_SALES, 0.1)
+                row += 1
+        row += 1  # Blank separator row
+
+    va21 = wb.create_sheet("VA21")
+    va21.cell(VA21Rows.HEADER_ROW, VA21Columns.WBE, "WBE")
+    row = VA21Rows.DATA_START_ROW
+    for wbe, cod, offer in [("CC00-A-PC00-IT", "M1", 1800.0), ("CC01-A-PC01-IT", 42, 1999.99)]:
+        va21.cell(row, VA21Columns.WBE, wbe)
+        va21.cell(row, VA21Columns.COD, cod)
+        va21.cell(row, VA21Columns.OFFER_TOTAL, offer)
+        row += 1
+    # Unmatched WBE given only in the backup column, in US form
+    va21.cell(row, VA21Columns.WBE_BACKUP, "ZZ1-B-XX01-US")
+    va21.cell(row, VA21Columns.COD, "M2")
+    va21.cell(row, VA21Columns.DESCRIPTION, "Extra scope")
+    va21.cell(row, VA21Columns.QUANTITY, 1)
+    va21.cell(row, VA21Columns.LISTINO_SUBTOTAL, 500.0)
+    va21.cell(row, VA21Columns.OFFER_TOTAL, 450.5)
+    va21.cell(row, VA21Columns.COST_SUBTOTAL, 300)
+    va21.cell(row, VA21Columns.MARGIN_PERCENTAGE, 0.25)
+
+    wb.save(path)
+
+
+def create_gap_workbook(path: str, gap: int) -> None:
+    """Write a NEW_OFFER1 sheet with two groups separated by gap fully blank rows"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "NEW_OFFER1"
+    row = ExcelRows.DATA_START_ROW
+    for group_idx in range(2):
+        ws.cell(row, ExcelColumns.PRIORITY, 1)
+        ws.cell(row, ExcelColumns.CODICE, f"TXT-G{group_idx}")
+        ws.cell(row, ExcelColumns.DENOMINAZIONE, f"Group {group_idx}")
+        row += 1 + gap
+    wb.save(path)
+
+
+def write_stale_dimensions(source: str, target: str) -> None:
+    """Copy an xlsx with every sheet's stored <dimension> shrunk to A1:B2, as some writers leave it"""
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename.startswith("xl/worksheets/"):
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:B2"', data)
+            zout.writestr(info, data)
+
+
+def parse_to_dict(path: str, use_calamine: bool, monkeypatch) -> dict:
+    """Parse path with the requested backend and dump the quotation without its timestamp"""
+    monkeypatch.setattr(direct_parser, "CALAMINE_AVAILABLE", use_calamine)
+    with DirectAnalisiProfittabilitaParser(path) as parser:
+        quotation = parser.parse()
+        assert parser.use_calamine == use_calamine
+    data = quotation.model_dump(mode="json")
+    data.pop("created_at", None)
+    return data
+
+
+def test_openpyxl_parses_sample(tmp_path, monkeypatch):
+    """The openpyxl read-only path reads every group, category and item across the blank rows"""
+    path = str(tmp_path / "sample_ap.xlsx")
+    create_sample_workbook(path)
+
+    result = parse_to_dict(path, False, monkeypatch)
+
+    groups = result["product_groups"]
+    assert [group["group_id"] for group in groups] == ["TXT-G0", "TXT-G1", "VA21"]
+    assert [len(category["items"]) for group in groups[:2] for category in group["categories"]] == [4, 4, 4, 4]
+    assert groups[0]["categories"][0]["offer_price"] == 1800.0
+    assert groups[2]["categories"][0]["wbe"] == "ZZ1-B-XX01-IT"
+
+    item = groups[0]["categories"][0]["items"][1]
+    assert item["code"] == "12346"
+    assert item["position"] == "20"
+    assert item["cod_listino"] == "7"
+    assert item["pricelist_unit_price"] == 100.0
+    assert result["totals"]["total_pricelist"] == 6500.0
+    assert result["totals"]["total_cost"] == 4301.0
+
+
+def test_openpyxl_ignores_stale_dimension(tmp_path, monkeypatch):
+    """A stale <dimension> tag must not cut the read-only sweeps short"""
+    path = str(tmp_path / "sample_ap.xlsx")
+    stale_path = str(tmp_path / "stale_ap.xlsx")
+    create_sample_workbook(path)
+    write_stale_dimensions(path, stale_path)
+
+    expected = parse_to_dict(path, False, monkeypatch)
+    result = parse_to_dict(stale_path, False, monkeypatch)
+
+    expected.pop("source_file", None)
+    result.pop("source_file", None)
+    assert result == expected
+
+
+@pytest.mark.parametrize("use_calamine", [False, True])
+def test_reads_past_gap_below_blank_run_limit(use_calamine, tmp_path, monkeypatch, caplog):
+    """A gap one row shorter than MAX_BLANK_RUN does not stop the sweep"""
+    path = str(tmp_path / "gap_ap.xlsx")
+    create_gap_workbook(path, ExcelRows.MAX_BLANK_RUN - 1)
+    if use_calamine:
+        pytest.importorskip("python_calamine")
+
+    result = parse_to_dict(path, use_calamine, monkeypatch)
+
+    assert [group["group_id"] for group in result["product_groups"]] == ["TXT-G0", "TXT-G1"]
+    assert "Stopped reading sheet" not in caplog.text
+
+
+@pytest.mark.parametrize("use_calamine", [False, True])
+def test_warns_when_gap_reaches_blank_run_limit(use_calamine, tmp_path, monkeypatch, caplog):
+    """A gap of MAX_BLANK_RUN rows stops the sweep and says where, instead of dropping data silently"""
+    path = str(tmp_path / "gap_ap.xlsx")
+    create_gap_workbook(path, ExcelRows.MAX_BLANK_RUN)
+    if use_calamine:
+        pytest.importorskip("python_calamine")
+
+    result = parse_to_dict(path, use_calamine, monkeypatch)
+
+    assert [group["group_id"] for group in result["product_groups"]] == ["TXT-G0"]
+    last_blank_row = ExcelRows.DATA_START_ROW + ExcelRows.MAX_BLANK_RUN
+    warnings = [record.getMessage() for record in caplog.records if record.levelname == "WARNING"]
+    assert any(f"Stopped reading sheet NEW_OFFER1 at row {last_blank_row}" in message for message in warnings)
+
+
+def test_calamine_matches_openpyxl(tmp_path, monkeypatch):
+    """Both readers must yield the same quotation for the same workbook"""
+    pytest.importorskip("python_calamine")
+
+    path = str(tmp_path / "sample_ap.xlsx")
+    create_sample_workbook(path)
+
+    openpyxl_result = parse_to_dict(path, False, monkeypatch)
+    calamine_result = parse_to_dict(path, True, monkeypatch)
+
+    assert calamine_result == openpyxl_result
+
+
+def test_calamine_rows_keep_numeric_floats(tmp_path, monkeypatch):
+    """Calamine rows only turn integral floats into int in text columns, like openpyxl codes"""
+    pytest.importorskip("python_calamine")
+
+    path = str(tmp_path / "sample_ap.xlsx")
+    create_sample_workbook(path)
+
+    monkeypatch.setattr(direct_parser, "CALAMINE_AVAILABLE", True)
+    with DirectAnalisiProfittabilitaParser(path) as parser:
+        parser.load_workbook()
+        rows = list(parser._iter_sheet_rows(parser.ws, 7, max_row=7, max_col=direct_parser.DATA_ROW_WIDTH,
+                                            key_col=ExcelColumns.PRIORITY,
+                                            text_cols=direct_parser.DATA_TEXT_COLUMNS))
+
+    # Row 7 is the second item of the first category: numeric code, integral price
+    row_values = rows[0]
+    assert row_values[ExcelColumns.CODICE - 1] == 12346
+    assert type(row_values[ExcelColumns.CODICE - 1]) is int
+    assert type(row_values[ExcelColumns.POSITION - 1]) is int
+    assert row_values[ExcelColumns.LIST_UNIT - 1] == 100.0
+    assert type(row_values[ExcelColumns.LIST_UNIT - 1]) is float
+    assert row_values[ExcelColumns.TOTALE - 1] is None
@@ -0,0 +1,143 @@
+"""
+Test script for the PRE file parser
+Pins the dicts built for category and item rows and the text fields of parse() output
+"""
+
+import sys
+import os
+
+from openpyxl import Workbook
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from parsers.pre_file_parser import (
+    PreFileParser, ExcelColumns, ExcelRows, _build_category, _build_item, DATA_ROW_WIDTH
+)
+
+
+# One OFFER1 data row (columns A..V) mixing float, int, numeric-string, null-token and empty cells
+SAMPLE_ROW = (
+    "E01Z",     # A  COD
+    None,       # B
+    "CODE1",    # C  CODICE
+    "Desc",     # D  DENOMINAZIONE
+    2,          # E  QTA
+    10.5,       # F  LIST_UNIT
+    21.0,       # G  LISTINO
+    100,        # H  SUB_TOT_LISTINO
+    "55.5",     # I  SUB_TOT_CODICE
+    1000.25,    # J  TOTALE
+    3,          # K  GRUPPI
+    1200.0,     # L  TOTALE_OFFERTA
+    "n/a",      # M  VALUTA
+    14.0,       # N  TOTALE_CODICE
+    15.0,       # O  TOTALE_SCONTATO
+    "Urgent",   # P  NOTE
+    4711,       # Q  COD_LISTINO
+    None,       # R  TOTAL_DISCOUNTED
+    7.25,       # S  COSTO_UNITARIO
+    14.5,       # T  COSTO
+    800,        # U  SUB_TOT_COSTO
+    812.75,     # V  TOTALE_COSTO
+)
+
+
+def typed_items(row_dict: dict) -> list:
+    """Key order, values and exact value types of a row dict"""
+    return [(key, value, type(value)) for key, value in row_dict.items()]
+
+
+def test_build_category_matches_layout():
+    """The generated category builder yields the keys, order and types of the hand-written dict"""
+    assert len(SAMPLE_ROW) == DATA_ROW_WIDTH
+
+    category = _build_category(SAMPLE_ROW, "E01Z", "CODE1", "Desc", [])
+
+    expected = {
+        "category_id": "E01Z",
+        "code": "CODE1",
+        "category_name": "Desc",
+        "items": [],
+        "subtotal_listino": 100.0,
+        "subtotal_codice": 55.5,
+        "total": 1000.25,
+        "groups": 3.0,
+        "total_offer": 1200.0,
+        "total_offer_currency": 0.0,
+        "total_code_currency": 0.0,
+        "total_discounted_currency": 0.0,
+        "notes": "Urgent",
+        "pricelist_code": "4711",
+        "total_discounted": 0.0,
+        "unit_cost": 7.25,
+        "subtotal_cost": 800.0,
+        "total_cost": 812.75,
+    }
+    assert typed_items(category) == typed_items(expected)
+
+
+def test_build_item_matches_layout():
+    """The generated item builder yields the keys, order and types of the hand-written dict"""
+    item = _build_item(SAMPLE_ROW, "18", "CODE1", "Desc")
+
+    expected = {
+        "position": "18",
+        "code": "CODE1",
+        "description": "Desc",
+        "quantity": 2.0,
+        "pricelist_unit_price": 10.5,
+        "pricelist_total_price": 21.0,
+        "notes": "Urgent",
+        "pricelist_code": "4711",
+        "unit_cost": 7.25,
+        "total_cost": 14.5,
+    }
+    assert typed_items(item) == typed_items(expected)
+
+
+
+def create_sample_workbook(path: str) -> None:
+    """Write a minimal OFFER1 sheet with one group, one category and three items"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "OFFER1"
+
+    row = ExcelRows.DATA_START_ROW
+    ws.cell(row, ExcelColumns.CODICE, "TXT-1")
+    ws.cell(row, ExcelColumns.DENOMINAZIONE, "Group 1")
+    row += 1
+
+    ws.cell(row, ExcelColumns.COD, "E01Z")
+    ws.cell(row, ExcelColumns.CODICE, "CODE1")
+    ws.cell(row, ExcelColumns.DENOMINAZIONE, "Category 1")
+    ws.cell(row, ExcelColumns.NOTE, "See drawing")
+    ws.cell(row, ExcelColumns.COD_LISTINO, 4711)
+    row += 1
+
+    # Text cells, empty cells and numeric cells in the NOTE and COD_LISTINO columns
+    for note, pricelist_code in [("Urgent", "LST-01"), (None, None), (12.5, 2024)]:
+        ws.cell(row, ExcelColumns.CODICE, f"IT{row}")
+        ws.cell(row, ExcelColumns.DENOMINAZIONE, "Item")
+        ws.cell(row, ExcelColumns.NOTE, note)
+        ws.cell(row, ExcelColumns.COD_LISTINO, pricelist_code)
+        row += 1
+
+    wb.save(path)
+
+
+def test_parse_keeps_notes_and_pricelist_codes_as_text(tmp_path):
+    """notes and pricelist_code are text in parse() output, with empty cells as empty strings"""
+    path = str(tmp_path / "sample_pre.xlsx")
+    create_sample_workbook(path)
+
+    result = PreFileParser(path).parse()
+
+    category = result["product_groups"][0]["categories"][0]
+    assert category["notes"] == "See drawing"
+    assert category["pricelist_code"] == "4711"
+    assert [(item["notes"], item["pricelist_code"]) for item in category["items"]] == [
+        ("Urgent", "LST-01"),
+        ("", ""),
+        ("12.5", "2024"),
+    ]
@@ -0,0 +1,34 @@
+"""
+Test script for the direct PRE file parser
+Checks the cached Decimal conversion of cell values
+"""
+
+import sys
+import os
+from decimal import Decimal
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from parsers.pre_file_parser_direct import DirectPreFileParser
+
+
+def test_safe_decimal_keeps_the_sign_of_zero():
+    """0.0 and -0.0 convert to their own Decimal whichever is seen first"""
+    parser = DirectPreFileParser("unused.xlsx")
+
+    values = (0.0, -0.0, 0.0, Decimal("-0"), Decimal("0"))
+    assert [str(parser._safe_decimal(value)) for value in values] == ["0.0", "-0.0", "0.0", "-0", "0"]
+
+
+def test_safe_decimal_cached_values_match_uncached():
+    """Repeated conversions return the same Decimal as the first one, and bools stay defaults"""
+    parser = DirectPreFileParser("unused.xlsx")
+
+    for value in (1, 1.0, 2.5, "1,234 €", "5%", " n/a ", True):
+        first = parser._safe_decimal(value, Decimal("9"))
+        second = parser._safe_decimal(value, Decimal("9"))
+        assert str(first) == str(second)
+    assert parser._safe_decimal(True) == Decimal("0.0")
+    assert str(parser._safe_decimal(1.0)) == "1.0"
+    assert str(parser._safe_decimal(1)) == "1"